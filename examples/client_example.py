@@ -15,7 +15,7 @@ def make_progress_bar(stats: UploadStats) -> None:
     pct = stats.uploaded_bytes / stats.total_bytes
     filled = int(50 * pct)
     bar = "=" * filled + "-" * (50 - filled)
-    speed = stats.upload_speed / 1024 / 1024
+    speed = stats.upload_speed_mbps
     print(
         f"\r[{bar}] {pct * 100:.1f}%  {stats.uploaded_bytes}/{stats.total_bytes} B"
         f"  {speed:.2f} MB/s",
@@ -60,8 +60,9 @@ def tus_upload_view(request, upload_id=None):
     if request.META.get("CONTENT_LENGTH"):
         headers["Content-Length"] = request.META["CONTENT_LENGTH"]
 
+    # HttpRequest is file-like; passing it streams the body instead of loading request.body
     status, resp_headers, body = tus_server.handle_request(
-        request.method, request.path, headers, request.body
+        request.method, request.path, headers, request
     )
 
     response = HttpResponse(body, status=status)
@@ -10,6 +10,7 @@ Run    : python examples/fastapi_example.py [port]
 
 import logging
 import sys
+import tempfile
 
 import uvicorn
 from fastapi import FastAPI, Request, Response
@@ -35,10 +36,17 @@ tus_server = TusServer(
 
 
 async def _handle(request: Request) -> Response:
-    body = await request.body()
-    status, resp_headers, resp_body = tus_server.handle_request(
-        request.method, request.url.path, dict(request.headers), body
-    )
+    # Spool the body (in memory up to 1 MB, then on disk) instead of request.body(),
+    # so large PATCH bodies are never held in RAM; the server streams it to storage
+    headers = dict(request.headers)
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as body:
+        async for block in request.stream():
+            body.write(block)
+        headers["content-length"] = str(body.tell())
+        body.seek(0)
+        status, resp_headers, resp_body = tus_server.handle_request(
+            request.method, request.url.path, headers, body
+        )
     return Response(content=resp_body, status_code=status, headers=resp_headers)
 
 
@@ -36,8 +36,9 @@ tus_server = TusServer(
 @app.route("/files", methods=["OPTIONS", "POST"])
 @app.route("/files/<upload_id>", methods=["HEAD", "PATCH", "DELETE"])
 def handle_upload(upload_id=None):
+    # request.stream lets the server copy the body to disk without buffering it
     status, resp_headers, body = tus_server.handle_request(
-        request.method, request.path, dict(request.headers), request.get_data()
+        request.method, request.path, dict(request.headers), request.stream
     )
     response = make_response(body, status)
     for key, value in resp_headers.items():
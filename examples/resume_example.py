@@ -26,7 +26,7 @@ def progress_bar(stats: UploadStats) -> None:
     pct = stats.uploaded_bytes / stats.total_bytes
     filled = int(40 * pct)
     bar = "=" * filled + "-" * (40 - filled)
-    speed = stats.upload_speed / 1024 / 1024
+    speed = stats.upload_speed_mbps
     chunks = f"{stats.chunks_completed} chunks"
     if stats.chunks_retried:
         chunks += f" ({stats.chunks_retried} retried)"
@@ -44,7 +44,9 @@ def main():
     server_url = sys.argv[1]
     file_path = sys.argv[2]
 
-    if not os.path.exists(file_path):
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
         print(f"File not found: {file_path}")
         sys.exit(1)
 
@@ -62,7 +64,6 @@ def main():
         url_storage=url_storage,
     )
 
-    file_size = os.path.getsize(file_path)
     print(f"File : {file_path}  ({file_size / 1024 / 1024:.1f} MB)")
     print("Store: .tus_urls.json")
     print()
@@ -11,7 +11,7 @@ from resumable_upload.exceptions import TusCommunicationError, TusUploadFailed
 from resumable_upload.fingerprint import Fingerprint
 from resumable_upload.server import TusHTTPRequestHandler, TusServer
 from resumable_upload.storage import SQLiteStorage, Storage
-from resumable_upload.url_storage import FileURLStorage, URLStorage
+from resumable_upload.url_storage import BufferedURLStorage, FileURLStorage, URLStorage
 
 __all__ = [
     "TusServer",
@@ -26,4 +26,5 @@ __all__ = [
     "Fingerprint",
     "URLStorage",
     "FileURLStorage",
+    "BufferedURLStorage",
 ]
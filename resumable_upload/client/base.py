@@ -1,19 +1,56 @@
 """TUS protocol client implementation."""
 
+import asyncio
 import base64
+import binascii
 import os
 import re
 import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import IO, Any, Callable, Optional, Union
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
+from resumable_upload.client.connection import ConnectionPool
 from resumable_upload.client.stats import UploadStats
-from resumable_upload.client.uploader import Uploader
+from resumable_upload.client.uploader import (
+    _ADAPTIVE_MAX_CHUNK_SIZE,
+    _ADAPTIVE_MIN_CHUNK_SIZE,
+    Uploader,
+    _get_hash_factory,
+    _is_seekable,
+    _RangeFileReader,
+    _stat_file_size,
+)
 from resumable_upload.exceptions import TusCommunicationError
 from resumable_upload.fingerprint import Fingerprint
-from resumable_upload.url_storage import FileURLStorage, URLStorage
+from resumable_upload.url_storage import BufferedURLStorage, FileURLStorage, URLStorage
+
+# Encoded Upload-Metadata pairs remembered per client (cleared when full)
+_METADATA_CACHE_SIZE = 256
+
+# Upload URLs whose HEAD response is remembered when head_cache_ttl is set
+_HEAD_CACHE_SIZE = 256
+
+# One "key base64value" pair of an Upload-Metadata header; the value may be omitted
+_METADATA_PAIR_RE = re.compile(r"([^\s,]+)(?: +([^\s,]*))?")
+
+
+def _parse_metadata_header(header: str, encoding: str) -> dict[str, str]:
+    """Decode an Upload-Metadata header into a dict.
+
+    Keys without a value map to "". Values that are not valid base64 or not
+    valid in encoding are kept raw.
+    """
+    metadata = {}
+    for key, value in _METADATA_PAIR_RE.findall(header):
+        try:
+            metadata[key] = base64.b64decode(value).decode(encoding)
+        except (ValueError, UnicodeDecodeError):
+            metadata[key] = value
+    return metadata
 
 
 class TusClient:
@@ -51,7 +88,7 @@ class TusClient:
     def __init__(
         self,
         url: str,
-        chunk_size: Union[int, float] = 1024 * 1024,
+        chunk_size: Union[int, float] = 8 * 1024 * 1024,
         checksum: bool = True,
         verify_tls_cert: bool = True,
         metadata_encoding: str = "utf-8",
@@ -62,12 +99,28 @@ class TusClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: float = 30.0,
+        prefetch_chunks: int = 0,
+        checksum_algorithm: str = "sha1",
+        retry_max_delay: float = 60.0,
+        retry_jitter: float = 0.1,
+        adaptive_chunk_size: bool = False,
+        send_buffer_size: Optional[int] = None,
+        use_mmap: bool = False,
+        upload_data_during_creation: bool = False,
+        direct_io: bool = False,
+        head_cache_ttl: float = 0.0,
+        parallel_uploads: int = 1,
+        progress_interval: float = 0.0,
+        min_chunk_size: int = _ADAPTIVE_MIN_CHUNK_SIZE,
+        max_chunk_size: int = _ADAPTIVE_MAX_CHUNK_SIZE,
     ):
         """Initialize TUS client.
 
         Args:
             url: Base URL of TUS server
-            chunk_size: Size of upload chunks in bytes (default: 1MB). Can be int or float.
+            chunk_size: Size of upload chunks in bytes (default: 8MB). Can be int or float.
+                Each chunk costs one PATCH round trip; use smaller chunks only when
+                finer retry/resume granularity matters more than throughput.
             checksum: Enable checksum verification (default: True)
             verify_tls_cert: Verify TLS certificates (default: True)
             metadata_encoding: Encoding for metadata values (default: utf-8)
@@ -78,15 +131,47 @@ class TusClient:
             max_retries: Maximum retry attempts for failed chunks (default: 3)
             retry_delay: Base delay between retry attempts in seconds (default: 1.0)
             timeout: Request timeout in seconds (default: 30.0)
+            prefetch_chunks: Chunks read ahead in a background thread while the
+                previous chunk is uploading (default: 0, disabled)
+            checksum_algorithm: hashlib algorithm used for Upload-Checksum (default: sha1)
+            retry_max_delay: Upper bound for the backoff delay in seconds (default: 60.0)
+            retry_jitter: Random +/- fraction applied to each backoff delay (default: 0.1)
+            adaptive_chunk_size: Scale the PATCH size from chunk_size toward ~0.5 s per
+                request, between min_chunk_size and max_chunk_size (default: False)
+            send_buffer_size: SO_SNDBUF in bytes for upload connections (default: None,
+                OS default; on Linux a fixed value disables autotuning)
+            use_mmap: Send file_path chunks as zero-copy slices of a read-only memory
+                map instead of reading them (default: False)
+            upload_data_during_creation: Send the first chunk in the creation POST
+                when the server supports creation-with-upload, saving one round
+                trip per upload (default: False)
+            direct_io: Read file_path uploads with O_DIRECT, bypassing the page
+                cache (default: False; Linux only, falls back to normal reads)
+            head_cache_ttl: Seconds a HEAD response is reused by get_metadata,
+                get_upload_info and resume_upload (default: 0.0, disabled). Uploads
+                through this client's methods invalidate it; changes made by
+                others are seen only after it expires.
+            parallel_uploads: Split new file_path uploads into this many partial
+                uploads sent concurrently and joined with the concatenation
+                extension, if the server supports it (default: 1, sequential)
+            progress_interval: Minimum seconds between progress_callback calls during
+                an upload, e.g. 0.05 for a redrawing progress bar; the final chunk
+                always reports (default: 0.0, every chunk)
+            min_chunk_size: Smallest PATCH size adaptive_chunk_size may pick
+                (default: 256 KB)
+            max_chunk_size: Largest PATCH size adaptive_chunk_size may pick
+                (default: 16 MB)
 
         Raises:
-            ValueError: If chunk_size is less than 1
+            ValueError: If chunk_size is less than 1 or checksum_algorithm is unsupported
         """
         if chunk_size < 1:
             raise ValueError(f"chunk_size must be at least 1 byte, got {chunk_size}")
+        _get_hash_factory(checksum_algorithm)
         self.url = url.rstrip("/")
         self.chunk_size = int(chunk_size)
         self.checksum = checksum
+        self.checksum_algorithm = checksum_algorithm.lower()
         self.verify_tls_cert = verify_tls_cert
         self.metadata_encoding = metadata_encoding
         self.store_url = store_url
@@ -98,8 +183,52 @@ class TusClient:
         self.headers = headers or {}
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
         self.timeout = timeout
+        self.prefetch_chunks = prefetch_chunks
+        self.parallel_uploads = parallel_uploads
+        self.progress_interval = progress_interval
+        self.adaptive_chunk_size = adaptive_chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.use_mmap = use_mmap
+        self.direct_io = direct_io
+        self.upload_data_during_creation = upload_data_during_creation
+        # Last get_server_info() result; extension checks reuse it instead of OPTIONS
+        self._server_info: Optional[dict[str, Any]] = None
+        self._server_probe_failed = False
+        # (key, value, encoding) -> encoded pair; constant fields repeat across uploads
+        self._metadata_cache: dict[tuple[Any, str, str], bytes] = {}
+        self.head_cache_ttl = head_cache_ttl
+        # upload URL -> (monotonic time, HEAD response headers)
+        self._head_cache: dict[str, tuple[float, Any]] = {}
         self.ssl_context = self._build_ssl_context()
+        # Shared keep-alive connections so chunks don't each pay a TCP/TLS handshake
+        self._pool = ConnectionPool(
+            ssl_context=self.ssl_context,
+            timeout=self.timeout,
+            maxsize=max(4, parallel_uploads),
+            send_buffer_size=send_buffer_size,
+        )
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close pooled connections."""
+        self.close()
+
+    def close(self) -> None:
+        """Close idle keep-alive connections held by the client.
+
+        Also flushes a BufferedURLStorage used as url_storage. The client stays
+        usable; later requests simply open new connections.
+        """
+        self._pool.close()
+        if isinstance(self.url_storage, BufferedURLStorage):
+            self.url_storage.flush()
 
     def _build_ssl_context(self) -> Optional[ssl.SSLContext]:
         """Build SSL context based on verify_tls_cert setting."""
@@ -117,6 +246,7 @@ class TusClient:
         metadata: Optional[dict[str, str]] = None,
         progress_callback: Optional[Callable[[UploadStats], None]] = None,
         stop_at: Optional[int] = None,
+        file_size: Optional[int] = None,
     ) -> str:
         """Upload a file to the server.
 
@@ -126,28 +256,36 @@ class TusClient:
             metadata: Optional metadata dictionary
             progress_callback: Optional callback function that receives UploadStats
             stop_at: Stop upload at this byte offset (for partial uploads)
+            file_size: Size of file_stream in bytes; skips measuring it by seeking.
+                Required for non-seekable streams (pipes, sockets), which are read
+                once, sequentially, from their current position (no store_url
+                fingerprinting).
 
         Returns:
             URL of the uploaded file
 
         Raises:
-            ValueError: If neither file_path nor file_stream provided
+            ValueError: If neither file_path nor file_stream provided, or a
+                non-seekable file_stream is given without file_size
             FileNotFoundError: If file doesn't exist
             TusCommunicationError: If upload fails
         """
         if not file_path and not file_stream:
             raise ValueError("Either file_path or file_stream must be provided")
 
-        if file_path and not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # One stat both checks existence and gives the size
+        path_size = _stat_file_size(file_path) if file_path else None
 
         # Get file size
-        if file_stream:
+        seekable = not file_stream or _is_seekable(file_stream)
+        if not file_stream:
+            file_size = path_size
+        elif file_size is None:
+            if not seekable:
+                raise ValueError("file_size is required for a non-seekable file_stream")
             file_stream.seek(0, os.SEEK_END)
             file_size = file_stream.tell()
             file_stream.seek(0)
-        else:
-            file_size = os.path.getsize(file_path)
 
         metadata = metadata or {}
 
@@ -156,19 +294,35 @@ class TusClient:
             metadata["filename"] = os.path.basename(file_path)
 
         # Calculate fingerprint once (avoid double computation)
+        # (a non-seekable stream can only be read once, for the upload itself)
+        store_url = self.store_url and seekable
         fingerprint = (
-            self.fingerprinter.get_fingerprint(file_path or file_stream) if self.store_url else None
+            self.fingerprinter.get_fingerprint(file_path or file_stream) if store_url else None
         )
 
         # Check for stored URL if enabled
         upload_url = None
-        if self.store_url:
+        if store_url:
             upload_url = self.url_storage.get_url(fingerprint)
 
-        # Create upload if no stored URL
+        if not upload_url and self._parallel_part_count(file_path, file_size, stop_at) > 1:
+            upload_url = self._upload_parallel(file_path, file_size, metadata, progress_callback)
+            if store_url:
+                self.url_storage.set_url(fingerprint, upload_url)
+            return upload_url
+
+        # Create upload if no stored URL; a new upload's offset comes from the
+        # creation response, so the uploader can skip its HEAD request
+        offset = None
         if not upload_url:
-            upload_url = self._create_upload(file_size, metadata)
-            if self.store_url:
+            initial_data = None
+            if self.upload_data_during_creation and seekable:
+                size = min(self.chunk_size, file_size if stop_at is None else stop_at)
+                extensions = self._server_extensions(probe=True)
+                if size > 0 and extensions is not None and "creation-with-upload" in extensions:
+                    initial_data = self._read_initial_data(file_path, file_stream, size)
+            upload_url, offset = self._post_upload(file_size, metadata, initial_data)
+            if store_url:
                 self.url_storage.set_url(fingerprint, upload_url)
 
         uploader = Uploader(
@@ -176,21 +330,65 @@ class TusClient:
             file_path=file_path,
             file_stream=file_stream,
             chunk_size=self.chunk_size,
-            checksum=self.checksum,
+            checksum=self._checksum_enabled(),
+            checksum_algorithm=self._checksum_algorithm(),
             metadata_encoding=self.metadata_encoding,
             headers=self.headers.copy(),
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
+            retry_max_delay=self.retry_max_delay,
+            retry_jitter=self.retry_jitter,
             ssl_context=self.ssl_context,
             timeout=self.timeout,
+            connection_pool=self._pool,
+            prefetch_chunks=self.prefetch_chunks,
+            adaptive_chunk_size=self.adaptive_chunk_size,
+            min_chunk_size=self.min_chunk_size,
+            max_chunk_size=self.max_chunk_size,
+            progress_interval=self.progress_interval,
+            use_mmap=self.use_mmap,
+            direct_io=self.direct_io,
+            offset=offset,
+            file_size=file_size,
         )
 
         try:
             uploader.upload(progress_callback=progress_callback, stop_at=stop_at)
             return uploader.url
         finally:
+            self._head_cache.pop(upload_url, None)
             uploader.close()
 
+    async def upload_file_async(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        metadata: Optional[dict[str, str]] = None,
+        progress_callback: Optional[Callable[[UploadStats], None]] = None,
+        stop_at: Optional[int] = None,
+        file_size: Optional[int] = None,
+    ) -> str:
+        """Upload a file without blocking the running event loop.
+
+        Runs upload_file in a worker thread, so several uploads can be awaited
+        concurrently (e.g. with ``asyncio.gather``) while sharing this client's
+        connection pool. progress_callback is called from that worker thread.
+
+        Args and exceptions are the same as for upload_file.
+
+        Returns:
+            URL of the uploaded file
+        """
+        return await asyncio.to_thread(
+            self.upload_file,
+            file_path,
+            file_stream,
+            metadata,
+            progress_callback,
+            stop_at,
+            file_size,
+        )
+
     def resume_upload(
         self,
         file_path: Optional[str] = None,
@@ -213,29 +411,45 @@ class TusClient:
             FileNotFoundError: If file doesn't exist
             HTTPError: If upload fails
         """
-        if file_path and not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
         if not file_path and not file_stream:
             raise ValueError("Either file_path or file_stream must be provided")
 
+        # A fresh cached HEAD (e.g. from get_upload_info()) spares the uploader its own
+        cached = self._cached_head(upload_url)
+        offset_str = cached.get("Upload-Offset") if cached is not None else None
+
+        # Uploader raises FileNotFoundError for a missing file_path
         uploader = Uploader(
             url=upload_url,
             file_path=file_path,
             file_stream=file_stream,
             chunk_size=self.chunk_size,
-            checksum=self.checksum,
+            checksum=self._checksum_enabled(),
+            checksum_algorithm=self._checksum_algorithm(),
             metadata_encoding=self.metadata_encoding,
             headers=self.headers.copy(),
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
+            retry_max_delay=self.retry_max_delay,
+            retry_jitter=self.retry_jitter,
             ssl_context=self.ssl_context,
             timeout=self.timeout,
+            connection_pool=self._pool,
+            prefetch_chunks=self.prefetch_chunks,
+            adaptive_chunk_size=self.adaptive_chunk_size,
+            min_chunk_size=self.min_chunk_size,
+            max_chunk_size=self.max_chunk_size,
+            progress_interval=self.progress_interval,
+            use_mmap=self.use_mmap,
+            direct_io=self.direct_io,
+            offset=int(offset_str) if offset_str else None,
         )
 
         try:
             uploader.upload(progress_callback=progress_callback)
             return uploader.url
         finally:
+            self._head_cache.pop(upload_url, None)
             uploader.close()
 
     def delete_upload(self, upload_url: str) -> None:
@@ -253,10 +467,9 @@ class TusClient:
             **self.headers,
         }
 
-        req = Request(upload_url, headers=headers, method="DELETE")
+        self._head_cache.pop(upload_url, None)
         try:
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout):
-                pass
+            self._pool.request("DELETE", upload_url, headers=headers)
         except (HTTPError, URLError) as e:
             if isinstance(e, HTTPError) and e.code == 404:
                 return  # Upload already deleted
@@ -271,41 +484,237 @@ class TusClient:
         initial_data: Optional[bytes] = None,
     ) -> str:
         """Create a new upload on the server."""
-        # Encode metadata
-        encoded_metadata = self.encode_metadata(metadata)
+        return self._post_upload(file_size, metadata, initial_data)[0]
 
-        headers = {
-            "Tus-Resumable": self.TUS_VERSION,
-            "Upload-Length": str(file_size),
-            **self.headers,
-        }
+    def _post_upload(
+        self,
+        file_size: Optional[int],
+        metadata: dict[str, str],
+        initial_data: Optional[bytes] = None,
+        upload_concat: Optional[str] = None,
+    ) -> tuple[str, Optional[int]]:
+        """Create a new upload and return its URL and offset.
+
+        file_size is None for a final concatenation upload, whose length the
+        server derives from upload_concat. The offset is None when it cannot be
+        trusted without a HEAD request: initial data was sent but the server
+        did not report Upload-Offset.
+        """
+        headers = {"Tus-Resumable": self.TUS_VERSION}
+        if file_size is not None:
+            headers["Upload-Length"] = str(file_size)
+        if upload_concat:
+            headers["Upload-Concat"] = upload_concat
+        headers.update(self.headers)
 
-        if encoded_metadata:
-            headers["Upload-Metadata"] = ",".join(encoded_metadata)
+        if metadata:
+            headers["Upload-Metadata"] = self._encode_metadata_header(metadata)
 
         body = b""
         if initial_data is not None:
             body = initial_data
             headers["Content-Type"] = "application/offset+octet-stream"
             headers["Content-Length"] = str(len(initial_data))
+            if self._checksum_enabled():
+                algorithm = self._checksum_algorithm()
+                digest = _get_hash_factory(algorithm)(initial_data).digest()
+                headers["Upload-Checksum"] = (
+                    f"{algorithm} {base64.b64encode(digest).decode('ascii')}"
+                )
 
         try:
-            req = Request(self.url, data=body or None, headers=headers, method="POST")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                location = response.headers.get("Location")
-                if not location:
-                    raise TusCommunicationError("Server did not return Location header")
-
-                # Handle relative URLs
-                if not location.startswith("http"):
-                    location = urljoin(self.url, location)
-
-                return location
+            response = self._pool.request("POST", self.url, headers=headers, body=body or None)
         except (HTTPError, URLError) as e:
             raise TusCommunicationError(
                 f"Failed to create upload: {str(e)}",
             ) from e
 
+        location = response.headers.get("Location")
+        if not location:
+            raise TusCommunicationError("Server did not return Location header")
+
+        # Handle relative URLs
+        if not location.startswith("http"):
+            location = urljoin(self.url, location)
+
+        offset_str = response.headers.get("Upload-Offset")
+        if offset_str is not None:
+            offset: Optional[int] = int(offset_str)
+        else:
+            offset = 0 if initial_data is None else None
+        return location, offset
+
+    def _parallel_part_count(
+        self, file_path: Optional[str], file_size: int, stop_at: Optional[int]
+    ) -> int:
+        """Return how many partial uploads a new upload is split into (1 = sequential).
+
+        Parallel uploads need a file_path (parts read it independently), the
+        whole file (no stop_at), more than one chunk of data, and a server that
+        advertises the concatenation extension.
+        """
+        if self.parallel_uploads <= 1 or not file_path or stop_at is not None:
+            return 1
+        parts = min(self.parallel_uploads, -(-file_size // self.chunk_size))
+        if parts <= 1:
+            return 1
+        extensions = self._server_extensions(probe=True)
+        if extensions is None or "concatenation" not in extensions:
+            return 1
+        return parts
+
+    def _upload_parallel(
+        self,
+        file_path: str,
+        file_size: int,
+        metadata: dict[str, str],
+        progress_callback: Optional[Callable[[UploadStats], None]],
+    ) -> str:
+        """Upload file_path as concurrent partial uploads joined by a final upload.
+
+        Each part is a separate ``Upload-Concat: partial`` upload sent by its
+        own Uploader over a range of one shared descriptor; the metadata goes
+        on the final upload. Progress reports combine all parts.
+
+        Returns:
+            URL of the final (concatenated) upload
+
+        Raises:
+            TusCommunicationError: If creating an upload fails
+            TusUploadFailed: If uploading a part fails
+        """
+        parts = self._parallel_part_count(file_path, file_size, None)
+        # Whole chunks per part, so only the last part ends with a short PATCH
+        chunks = -(-file_size // self.chunk_size)
+        part_size = -(-chunks // parts) * self.chunk_size
+        ranges = [
+            (start, min(part_size, file_size - start)) for start in range(0, file_size, part_size)
+        ]
+        uploaders: list[Optional[Uploader]] = [None] * len(ranges)
+        progress_lock = threading.Lock()
+
+        def report(_stats: UploadStats) -> None:
+            with progress_lock:
+                part_stats = [u.stats for u in uploaders if u is not None]
+                progress_callback(
+                    UploadStats(
+                        total_bytes=file_size,
+                        uploaded_bytes=sum(s.uploaded_bytes for s in part_stats),
+                        chunks_completed=sum(s.chunks_completed for s in part_stats),
+                        chunks_failed=sum(s.chunks_failed for s in part_stats),
+                        chunks_retried=sum(s.chunks_retried for s in part_stats),
+                        start_time=min(s.start_time for s in part_stats),
+                    )
+                )
+
+        def upload_part(index: int, fd: int) -> str:
+            start, length = ranges[index]
+            part_url, offset = self._post_upload(length, {}, upload_concat="partial")
+            uploader = Uploader(
+                url=part_url,
+                file_stream=_RangeFileReader(fd, start, length),
+                chunk_size=self.chunk_size,
+                checksum=self._checksum_enabled(),
+                checksum_algorithm=self._checksum_algorithm(),
+                metadata_encoding=self.metadata_encoding,
+                headers=self.headers.copy(),
+                max_retries=self.max_retries,
+                retry_delay=self.retry_delay,
+                retry_max_delay=self.retry_max_delay,
+                retry_jitter=self.retry_jitter,
+                ssl_context=self.ssl_context,
+                timeout=self.timeout,
+                connection_pool=self._pool,
+                adaptive_chunk_size=self.adaptive_chunk_size,
+                min_chunk_size=self.min_chunk_size,
+                max_chunk_size=self.max_chunk_size,
+                progress_interval=self.progress_interval,
+                offset=offset,
+            )
+            uploaders[index] = uploader
+            try:
+                uploader.upload(progress_callback=report if progress_callback else None)
+            finally:
+                uploader.close()
+            return part_url
+
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(upload_part, i, fd) for i in range(len(ranges))]
+                try:
+                    part_urls = [future.result() for future in futures]
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(fd)
+
+        upload_url, _ = self._post_upload(
+            None, metadata, upload_concat="final;" + " ".join(part_urls)
+        )
+        return upload_url
+
+    @staticmethod
+    def _read_initial_data(file_path: Optional[str], file_stream: Optional[IO], size: int) -> bytes:
+        """Read the first size bytes of the upload for creation-with-upload."""
+        if file_stream:
+            file_stream.seek(0)
+            data = file_stream.read(size)
+            file_stream.seek(0)
+            return data
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read(size)
+
+    def _server_extensions(self, probe: bool = False) -> Optional[list[str]]:
+        """Return the extensions the server advertises, or None if unknown.
+
+        Uses the cached get_server_info() result. With probe=True a missing
+        result is fetched once; a failed probe is remembered and not repeated.
+        """
+        if self._server_info is None and probe and not self._server_probe_failed:
+            try:
+                self.get_server_info()
+            except TusCommunicationError:
+                self._server_probe_failed = True
+        return self._server_info["extensions"] if self._server_info is not None else None
+
+    def _checksum_enabled(self) -> bool:
+        """Return whether uploads should hash chunks for Upload-Checksum.
+
+        Checksums are skipped when the server is known (from a cached OPTIONS
+        result) not to support the checksum extension, since it would ignore them,
+        or to accept none of the algorithms hashlib provides.
+        """
+        if not self.checksum:
+            return False
+        extensions = self._server_extensions()
+        if extensions is None:
+            return True
+        if "checksum" not in extensions:
+            return False
+        supported = self._server_info["checksum_algorithms"]
+        return not supported or self._checksum_algorithm() in supported
+
+    def _checksum_algorithm(self) -> str:
+        """Return the Upload-Checksum algorithm to use for uploads.
+
+        The configured checksum_algorithm, unless a cached OPTIONS result lists
+        Tus-Checksum-Algorithm without it; then the first listed algorithm that
+        hashlib supports.
+        """
+        supported = self._server_info["checksum_algorithms"] if self._server_info else None
+        if not supported or self.checksum_algorithm in supported:
+            return self.checksum_algorithm
+        for algorithm in supported:
+            try:
+                _get_hash_factory(algorithm)
+            except ValueError:
+                continue
+            return algorithm
+        return self.checksum_algorithm
+
     def encode_metadata(self, metadata: dict[str, str]) -> list:
         """
         Encode metadata according to TUS protocol specification.
@@ -321,20 +730,57 @@ class TusClient:
         """
         encoded_list = []
         for key, value in metadata.items():
-            key_str = str(key)
-
-            # Validate key does not contain spaces or commas
-            if re.search(r"^$|[\s,]+", key_str):
-                raise ValueError(
-                    f'Upload-metadata key "{key_str}" cannot be empty nor contain spaces or commas.'
-                )
-
+            key_str = self._validate_metadata_key(key)
             value_bytes = value.encode(self.metadata_encoding)
-            encoded_value = base64.b64encode(value_bytes).decode("ascii")
+            encoded_value = binascii.b2a_base64(value_bytes, newline=False).decode("ascii")
             encoded_list.append(f"{key_str} {encoded_value}")
 
         return encoded_list
 
+    def _encode_metadata_header(self, metadata: dict[str, str]) -> str:
+        """Build the Upload-Metadata header value in a single bytes join.
+
+        Equivalent to ``",".join(self.encode_metadata(metadata))`` but skips
+        the per-pair decode and f-string round-trips, and reuses pairs already
+        encoded for earlier uploads.
+        """
+        encoding = self.metadata_encoding
+        cache = self._metadata_cache
+        pairs = []
+        for key, value in metadata.items():
+            cache_key = (key, value, encoding)
+            pair = cache.get(cache_key)
+            if pair is None:
+                pair = b"%s %s" % (
+                    self._validate_metadata_key(key).encode("latin-1"),
+                    binascii.b2a_base64(value.encode(encoding), newline=False),
+                )
+                if len(cache) >= _METADATA_CACHE_SIZE:
+                    cache.clear()
+                cache[cache_key] = pair
+            pairs.append(pair)
+        return b",".join(pairs).decode("latin-1")
+
+    @staticmethod
+    def _validate_metadata_key(key: Any) -> str:
+        """Return key as a string, rejecting empty keys and keys with spaces or commas."""
+        key_str = str(key)
+        # Fast path for typical keys: printable ASCII has no whitespace but " "
+        if (
+            key_str
+            and key_str.isascii()
+            and key_str.isprintable()
+            and " " not in key_str
+            and "," not in key_str
+        ):
+            return key_str
+        # Otherwise scan for any (Unicode) whitespace, without a regex
+        if not key_str or "," in key_str or any(c.isspace() for c in key_str):
+            raise ValueError(
+                f'Upload-metadata key "{key_str}" cannot be empty nor contain spaces or commas.'
+            )
+        return key_str
+
     def get_file_size(self, file_source: Union[str, IO]) -> int:
         """
         Get the size of a file.
@@ -422,37 +868,11 @@ class TusClient:
             >>> metadata = client.get_metadata("http://localhost:8080/files/abc123")
             >>> # {"filename": "test.bin", "content-type": "application/octet-stream"}
         """
-        headers = {
-            "Tus-Resumable": self.TUS_VERSION,
-            **self.headers,
-        }
-
-        try:
-            req = Request(upload_url, headers=headers, method="HEAD")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                upload_metadata = response.headers.get("Upload-Metadata")
-                if not upload_metadata:
-                    return {}
-
-                # Parse metadata
-                metadata = {}
-                for pair in upload_metadata.split(","):
-                    pair = pair.strip()
-                    if " " in pair:
-                        key, value = pair.split(" ", 1)
-                        # Decode base64 value
-                        try:
-                            decoded_value = base64.b64decode(value).decode(self.metadata_encoding)
-                            metadata[key] = decoded_value
-                        except (ValueError, UnicodeDecodeError):
-                            # If decoding fails, use raw value
-                            metadata[key] = value
-
-                return metadata
-        except (HTTPError, URLError) as e:
-            raise TusCommunicationError(
-                f"Failed to get metadata: {str(e)}",
-            ) from e
+        response_headers = self._head(upload_url, "Failed to get metadata")
+        upload_metadata = response_headers.get("Upload-Metadata")
+        if not upload_metadata:
+            return {}
+        return _parse_metadata_header(upload_metadata, self.metadata_encoding)
 
     def get_upload_info(self, upload_url: str) -> dict[str, Any]:
         """Get upload information including offset, length, and metadata.
@@ -476,56 +896,76 @@ class TusClient:
             >>> print(f"Progress: {info['offset']}/{info['length']}")
             >>> print(f"Complete: {info['complete']}")
         """
+        response_headers = self._head(upload_url, "Failed to get upload info")
+        offset_str = response_headers.get("Upload-Offset")
+        length_str = response_headers.get("Upload-Length")
+
+        offset = int(offset_str) if offset_str else 0
+        length = int(length_str) if length_str else 0
+        complete = length > 0 and offset >= length
+
+        upload_metadata = response_headers.get("Upload-Metadata")
+        metadata = (
+            _parse_metadata_header(upload_metadata, self.metadata_encoding)
+            if upload_metadata
+            else {}
+        )
+
+        return {
+            "offset": offset,
+            "length": length,
+            "complete": complete,
+            "metadata": metadata,
+        }
+
+    def _cached_head(self, upload_url: str) -> Optional[Any]:
+        """Return the remembered HEAD response headers for upload_url if still fresh."""
+        cached = self._head_cache.get(upload_url)
+        if cached is None or time.monotonic() - cached[0] >= self.head_cache_ttl:
+            return None
+        return cached[1]
+
+    def _head(self, upload_url: str, error_message: str) -> Any:
+        """Send HEAD for upload_url (or reuse a fresh cached response) and return its headers.
+
+        Raises:
+            TusCommunicationError: If the request fails, with error_message as prefix
+        """
+        cached = self._cached_head(upload_url)
+        if cached is not None:
+            return cached
+
         headers = {
             "Tus-Resumable": self.TUS_VERSION,
             **self.headers,
         }
-
         try:
-            req = Request(upload_url, headers=headers, method="HEAD")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                offset_str = response.headers.get("Upload-Offset")
-                length_str = response.headers.get("Upload-Length")
-
-                offset = int(offset_str) if offset_str else 0
-                length = int(length_str) if length_str else 0
-                complete = length > 0 and offset >= length
-
-                # Get metadata
-                metadata = {}
-                upload_metadata = response.headers.get("Upload-Metadata")
-                if upload_metadata:
-                    for pair in upload_metadata.split(","):
-                        pair = pair.strip()
-                        if " " in pair:
-                            key, value = pair.split(" ", 1)
-                            try:
-                                decoded_value = base64.b64decode(value).decode(
-                                    self.metadata_encoding
-                                )
-                                metadata[key] = decoded_value
-                            except (ValueError, UnicodeDecodeError):
-                                metadata[key] = value
-
-                return {
-                    "offset": offset,
-                    "length": length,
-                    "complete": complete,
-                    "metadata": metadata,
-                }
+            response = self._pool.request("HEAD", upload_url, headers=headers)
         except (HTTPError, URLError) as e:
-            raise TusCommunicationError(
-                f"Failed to get upload info: {str(e)}",
-            ) from e
+            raise TusCommunicationError(f"{error_message}: {str(e)}") from e
+
+        if self.head_cache_ttl > 0:
+            if len(self._head_cache) >= _HEAD_CACHE_SIZE:
+                self._head_cache.clear()
+            self._head_cache[upload_url] = (time.monotonic(), response.headers)
+        return response.headers
 
     def get_server_info(self) -> dict[str, Union[str, list[str], Optional[int]]]:
         """Get server information and capabilities via OPTIONS request.
 
+        The result is cached on the client for extension checks made during
+        uploads; calling this method always sends a fresh request. Once known,
+        uploads skip checksum hashing if the server lacks the checksum
+        extension, and switch checksum_algorithm to one the server lists in
+        Tus-Checksum-Algorithm if it does not accept the configured one.
+
         Returns:
             Dictionary containing:
                 - version (str): TUS protocol version supported by server
                 - extensions (list[str]): List of supported TUS extensions
                 - max_size (int | None): Maximum upload size in bytes (None if unlimited)
+                - checksum_algorithms (list[str]): Checksum algorithms the server accepts
+                  (empty if not advertised)
 
         Raises:
             TusCommunicationError: If request fails
@@ -538,30 +978,37 @@ class TusClient:
             >>> print(f"Max Size: {info['max_size']}")
         """
         try:
-            req = Request(self.url, method="OPTIONS")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                tus_version = response.headers.get("Tus-Version", self.TUS_VERSION)
-                tus_extension = response.headers.get("Tus-Extension", "")
-                tus_max_size = response.headers.get("Tus-Max-Size")
-
-                extensions = (
-                    [ext.strip() for ext in tus_extension.split(",") if ext.strip()]
-                    if tus_extension
-                    else []
-                )
-
-                max_size = int(tus_max_size) if tus_max_size else None
-
-                return {
-                    "version": tus_version,
-                    "extensions": extensions,
-                    "max_size": max_size,
-                }
+            response = self._pool.request("OPTIONS", self.url)
         except (HTTPError, URLError) as e:
             raise TusCommunicationError(
                 f"Failed to get server info: {str(e)}",
             ) from e
 
+        tus_version = response.headers.get("Tus-Version", self.TUS_VERSION)
+        tus_extension = response.headers.get("Tus-Extension", "")
+        tus_max_size = response.headers.get("Tus-Max-Size")
+
+        extensions = (
+            [ext.strip() for ext in tus_extension.split(",") if ext.strip()]
+            if tus_extension
+            else []
+        )
+
+        max_size = int(tus_max_size) if tus_max_size else None
+        checksum_algorithms = [
+            algorithm.strip().lower()
+            for algorithm in response.headers.get("Tus-Checksum-Algorithm", "").split(",")
+            if algorithm.strip()
+        ]
+
+        self._server_info = {
+            "version": tus_version,
+            "extensions": extensions,
+            "max_size": max_size,
+            "checksum_algorithms": checksum_algorithms,
+        }
+        return dict(self._server_info)
+
     def create_uploader(
         self,
         file_path: Optional[str] = None,
@@ -600,16 +1047,17 @@ class TusClient:
             file_size = file_stream.tell()
             file_stream.seek(0)
         else:
-            if not file_path or not os.path.exists(file_path):
+            if not file_path:
                 raise FileNotFoundError(f"File not found: {file_path}")
-            file_size = os.path.getsize(file_path)
+            file_size = _stat_file_size(file_path)
 
-        # Create upload if URL not provided
+        # Create upload if URL not provided; a new upload starts at offset 0
+        offset = None
         if not upload_url:
             metadata = metadata or {}
             if "filename" not in metadata and file_path:
                 metadata["filename"] = os.path.basename(file_path)
-            upload_url = self._create_upload(file_size, metadata)
+            upload_url, offset = self._post_upload(file_size, metadata)
 
         # Create uploader
         actual_chunk_size = chunk_size if chunk_size is not None else self.chunk_size
@@ -618,11 +1066,23 @@ class TusClient:
             file_path=file_path,
             file_stream=file_stream,
             chunk_size=actual_chunk_size,
-            checksum=self.checksum,
+            checksum=self._checksum_enabled(),
+            checksum_algorithm=self._checksum_algorithm(),
             metadata_encoding=self.metadata_encoding,
             headers=self.headers.copy(),
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
+            retry_max_delay=self.retry_max_delay,
+            retry_jitter=self.retry_jitter,
             ssl_context=self.ssl_context,
             timeout=self.timeout,
+            connection_pool=self._pool,
+            prefetch_chunks=self.prefetch_chunks,
+            adaptive_chunk_size=self.adaptive_chunk_size,
+            min_chunk_size=self.min_chunk_size,
+            max_chunk_size=self.max_chunk_size,
+            progress_interval=self.progress_interval,
+            use_mmap=self.use_mmap,
+            direct_io=self.direct_io,
+            offset=offset,
         )
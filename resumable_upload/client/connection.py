@@ -0,0 +1,394 @@
+"""Keep-alive HTTP connection pool for the TUS client."""
+
+import contextlib
+import http.client
+import io
+import os
+import socket
+import ssl
+import threading
+import urllib.request
+from base64 import b64encode
+from typing import Any, Optional, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlsplit
+
+# Errors that indicate an idle keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Bodies up to this size are sent in the same write as the headers. http.client
+# always sends them separately, which with TCP_NODELAY costs a second segment;
+# joining a small body is cheaper, while large chunks are sent in place.
+_COALESCE_MAX_BODY_SIZE = 64 * 1024
+
+# Read size for file-like request bodies (http.client defaults to 8 KB)
+_STREAM_BLOCK_SIZE = 256 * 1024
+
+# Error response bodies are read up to this size; the connection is dropped
+# rather than drained if more remains
+_MAX_ERROR_BODY_SIZE = 4096
+
+
+def _tune_socket(sock: socket.socket, send_buffer_size: Optional[int]) -> None:
+    """Disable Nagle and optionally size the send buffer (best effort)."""
+    # Avoids delayed-ACK stalls on the small tail of a PATCH
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if send_buffer_size:
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size)
+
+
+def _send_headers(
+    conn: http.client.HTTPConnection, method: str, path: str, headers: dict[str, str]
+) -> None:
+    """Send the request line and headers only, as HTTPConnection.request would."""
+    names = {name.lower() for name in headers}
+    conn.putrequest(
+        method,
+        path,
+        skip_host="host" in names,
+        skip_accept_encoding="accept-encoding" in names,
+    )
+    for name, value in headers.items():
+        conn.putheader(name, value)
+    conn.endheaders()
+
+
+class _CoalescingMixin:
+    """Sends the request head and a small bytes-like body in one write."""
+
+    def _send_output(self, message_body: Any = None, encode_chunked: bool = False) -> None:
+        if (
+            message_body is None
+            or encode_chunked
+            or hasattr(message_body, "read")
+            or memoryview(message_body).nbytes > _COALESCE_MAX_BODY_SIZE
+        ):
+            super()._send_output(message_body, encode_chunked)
+            return
+        # Same as HTTPConnection._send_output, with the body joined to the head
+        self._buffer.extend((b"", b""))
+        msg = b"\r\n".join(self._buffer) + message_body
+        del self._buffer[:]
+        self.send(msg)
+
+
+class _HTTPConnection(_CoalescingMixin, http.client.HTTPConnection):
+    """HTTPConnection that tunes its socket once connected.
+
+    proxy_headers (e.g. Proxy-Authorization) are added to every request when
+    the connection goes to a plain HTTP proxy.
+    """
+
+    send_buffer_size: Optional[int] = None
+    proxy_headers: Optional[dict[str, str]] = None
+
+    def putrequest(self, method: str, url: str, *args: Any, **kwargs: Any) -> None:
+        super().putrequest(method, url, *args, **kwargs)
+        for name, value in (self.proxy_headers or {}).items():
+            self.putheader(name, value)
+
+    def connect(self) -> None:
+        super().connect()
+        _tune_socket(self.sock, self.send_buffer_size)
+
+
+class _HTTPSConnection(_CoalescingMixin, http.client.HTTPSConnection):
+    """HTTPSConnection that tunes its socket and resumes earlier TLS sessions.
+
+    tls_sessions is shared by the pool's connections, so a reconnect to the
+    same server offers the last session ticket and skips the full handshake.
+    """
+
+    send_buffer_size: Optional[int] = None
+    tls_sessions: Optional[dict[tuple[str, Optional[int]], ssl.SSLSession]] = None
+
+    def _session_key(self) -> tuple[str, Optional[int]]:
+        return (self._tunnel_host or self.host, self.port)
+
+    def connect(self) -> None:
+        # Same as HTTPSConnection.connect, but passes the session to resume
+        http.client.HTTPConnection.connect(self)
+        _tune_socket(self.sock, self.send_buffer_size)
+        session = self.tls_sessions.get(self._session_key()) if self.tls_sessions else None
+        try:
+            self.sock = self._context.wrap_socket(
+                self.sock, server_hostname=self._tunnel_host or self.host, session=session
+            )
+        except ValueError as e:
+            # e.g. a session from another SSLContext; report it like other TLS errors
+            self.sock.close()
+            raise ssl.SSLError(str(e)) from e
+
+    def save_tls_session(self) -> None:
+        """Remember this connection's TLS session for the next connection."""
+        # TLS 1.3 tickets arrive after the handshake, so this runs after a response
+        session = getattr(self.sock, "session", None)
+        if session is not None and self.tls_sessions is not None:
+            self.tls_sessions[self._session_key()] = session
+
+    def close(self) -> None:
+        self.save_tls_session()
+        super().close()
+
+
+class ConnectionPool:
+    """Pool of persistent HTTP connections reused across TUS requests.
+
+    ``urllib.request.urlopen`` opens a fresh TCP (and TLS) connection for every
+    request, so each chunk of an upload pays a full handshake. This pool keeps
+    idle ``http.client`` connections open per origin and hands them out again
+    for the next request. New HTTPS connections resume the last TLS session
+    to the same server, so reconnecting skips the full handshake.
+
+    Errors are raised as ``urllib.error.HTTPError`` (for status >= 400) and
+    ``urllib.error.URLError`` (for network failures), matching ``urlopen``.
+    Like ``urlopen``, the ``http_proxy``/``https_proxy``/``no_proxy``
+    environment (or system) proxy settings are honored: HTTPS goes through
+    a CONNECT tunnel, HTTP sends absolute-URI requests to the proxy.
+
+    Thread-safe: concurrent requests each use their own connection.
+    """
+
+    def __init__(
+        self,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        timeout: float = 30.0,
+        maxsize: int = 4,
+        send_buffer_size: Optional[int] = None,
+    ):
+        """Initialize connection pool.
+
+        Connections are opened with TCP_NODELAY set.
+
+        Args:
+            ssl_context: Optional SSL context for HTTPS connections (default:
+                one ``ssl.create_default_context()`` shared by all of them)
+            timeout: Socket timeout in seconds (default: 30.0)
+            maxsize: Maximum idle connections kept per origin (default: 4)
+            send_buffer_size: SO_SNDBUF in bytes for new connections, e.g. 4 MB on
+                high bandwidth-delay links (default: None, OS default). On Linux a
+                fixed value disables send-buffer autotuning.
+        """
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.send_buffer_size = send_buffer_size
+        self._idle: dict[tuple[str, str, Optional[int]], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        # Created on first HTTPS connection when ssl_context is None; a TLS
+        # session can only be resumed by connections sharing its SSLContext
+        self._default_ssl_context: Optional[ssl.SSLContext] = None
+        # (host, port) -> last TLS session, offered again by new HTTPS connections
+        self._tls_sessions: dict[tuple[str, Optional[int]], ssl.SSLSession] = {}
+        # Read once, like urlopen's default opener; origin -> proxy URL or None
+        self._proxies = urllib.request.getproxies()
+        self._origin_proxies: dict[tuple[str, str, Optional[int]], Optional[str]] = {}
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close all idle connections."""
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _proxy_for(self, origin: tuple[str, str, Optional[int]]) -> Optional[str]:
+        """Return the proxy URL to reach origin through, or None to connect directly."""
+        if origin not in self._origin_proxies:
+            scheme, host, port = origin
+            proxy = self._proxies.get(scheme)
+            netloc = host if port is None else f"{host}:{port}"
+            if proxy and urllib.request.proxy_bypass(netloc):
+                proxy = None
+            if proxy and "://" not in proxy:
+                proxy = f"http://{proxy}"
+            self._origin_proxies[origin] = proxy
+        return self._origin_proxies[origin]
+
+    def _https_context(self) -> ssl.SSLContext:
+        """Return the SSL context shared by the pool's HTTPS connections."""
+        if self.ssl_context is not None:
+            return self.ssl_context
+        with self._lock:
+            if self._default_ssl_context is None:
+                context = ssl.create_default_context()
+                # Same ALPN offer HTTPSConnection makes with its own default context
+                context.set_alpn_protocols(["http/1.1"])
+                self._default_ssl_context = context
+            return self._default_ssl_context
+
+    def _new_connection(self, origin: tuple[str, str, Optional[int]]) -> http.client.HTTPConnection:
+        """Open a new connection for origin (scheme, host, port), via its proxy if any."""
+        scheme, host, port = origin
+        proxy_headers: dict[str, str] = {}
+        proxy = self._proxy_for(origin)
+        if proxy:
+            proxy_parts = urlsplit(proxy)
+            if proxy_parts.username is not None:
+                credentials = (
+                    f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+                )
+                proxy_headers["Proxy-Authorization"] = (
+                    f"Basic {b64encode(credentials.encode()).decode('ascii')}"
+                )
+            connect_host, connect_port = proxy_parts.hostname, proxy_parts.port
+        else:
+            connect_host, connect_port = host, port
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            conn = _HTTPSConnection(
+                connect_host,
+                connect_port,
+                timeout=self.timeout,
+                context=self._https_context(),
+                blocksize=_STREAM_BLOCK_SIZE,
+            )
+            conn.tls_sessions = self._tls_sessions
+            if proxy:
+                conn.set_tunnel(host, port, headers=proxy_headers)
+        else:
+            conn = _HTTPConnection(
+                connect_host, connect_port, timeout=self.timeout, blocksize=_STREAM_BLOCK_SIZE
+            )
+            conn.proxy_headers = proxy_headers
+        conn.send_buffer_size = self.send_buffer_size
+        return conn
+
+    def _acquire(
+        self, origin: tuple[str, str, Optional[int]]
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection for origin (or a new one) and whether it was reused."""
+        with self._lock:
+            conns = self._idle.get(origin)
+            if conns:
+                return conns.pop(), True
+        return self._new_connection(origin), False
+
+    def _release(
+        self, origin: tuple[str, str, Optional[int]], conn: http.client.HTTPConnection
+    ) -> None:
+        """Return a connection to the idle pool, closing it if the pool is full."""
+        with self._lock:
+            conns = self._idle.setdefault(origin, [])
+            if len(conns) < self.maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[Union[bytes, bytearray, memoryview, Any]] = None,
+    ) -> http.client.HTTPResponse:
+        """Send a request and return the response with its body already consumed.
+
+        Error bodies are read only up to 4 KB (available via ``HTTPError.read()``).
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            headers: Request headers
+            body: Optional request body. Any bytes-like object is handed to the
+                socket as-is (``sendall``), so a ``memoryview`` slice is sent
+                without being copied into a new ``bytes`` object first.
+                ``Content-Length`` is added when missing, so bodies are never
+                sent with chunked transfer encoding. Bodies up to 64 KB are
+                joined to the request head and go out in one socket write. A
+                file-like object (with ``read``, ``tell`` and ``seek``) is
+                streamed in blocks from its current position; without a
+                ``Content-Length`` header, the rest of the file up to its end
+                is sent. Over plain HTTP, a body with a ``sendfile(sock)``
+                method writes itself to the socket after the headers
+                (zero-copy ``os.sendfile``).
+
+        Returns:
+            The HTTP response (headers available via ``response.headers``)
+
+        Raises:
+            HTTPError: If the server responds with status >= 400
+            URLError: If the request fails at the network level
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"Unsupported URL: {url}")
+        origin = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        headers = dict(headers) if headers else {}
+        if parts.scheme == "http" and self._proxy_for(origin):
+            # Plain HTTP proxies take the absolute URI in the request line
+            path = f"http://{parts.netloc}{path}"
+        body_start = None
+        sendfile = None
+        if hasattr(body, "read"):
+            body_start = body.tell()
+            if not any(k.lower() == "content-length" for k in headers):
+                headers["Content-Length"] = str(body.seek(0, os.SEEK_END) - body_start)
+                body.seek(body_start)
+            if parts.scheme == "http" and hasattr(os, "sendfile"):
+                # TLS sockets would fall back to send(), so only plain HTTP
+                sendfile = getattr(body, "sendfile", None)
+        elif body is not None:
+            size = memoryview(body).nbytes
+            if not any(k.lower() == "content-length" for k in headers):
+                # Explicit length keeps http.client from falling back to chunked encoding
+                headers["Content-Length"] = str(size)
+
+        while True:
+            conn, reused = self._acquire(origin)
+            try:
+                if sendfile is not None:
+                    _send_headers(conn, method, path, headers)
+                    sendfile(conn.sock)
+                else:
+                    conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                if response.status >= 400:
+                    # Don't pull a large HTML error page through Python; a
+                    # connection with unread body left is closed, not reused
+                    content = response.read(_MAX_ERROR_BODY_SIZE)
+                else:
+                    content = response.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused:
+                    # Server dropped the idle keep-alive connection; retry on a fresh one
+                    if body_start is not None:
+                        body.seek(body_start)
+                    continue
+                raise URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise URLError(e) from e
+            break
+
+        if response.will_close or not response.isclosed():
+            conn.close()
+        else:
+            if isinstance(conn, _HTTPSConnection):
+                conn.save_tls_session()
+            self._release(origin, conn)
+
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, io.BytesIO(content)
+            )
+        return response
@@ -1,10 +1,16 @@
 """Upload statistics tracking for TUS client."""
 
+import sys
 import time
 from dataclasses import dataclass
 
+_MIB = 1024 * 1024
 
-@dataclass
+# __slots__ instead of a per-instance __dict__ where dataclasses support it (3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class UploadStats:
     """Statistics for upload progress.
 
@@ -36,14 +42,16 @@ class UploadStats:
     @property
     def upload_speed(self) -> float:
         """Get upload speed in bytes/second."""
-        if self.elapsed_time > 0:
-            return self.uploaded_bytes / self.elapsed_time
+        # Read the clock once so the check and the division agree
+        elapsed = self.elapsed_time
+        if elapsed > 0:
+            return self.uploaded_bytes / elapsed
         return 0.0
 
     @property
     def upload_speed_mbps(self) -> float:
         """Get upload speed in MB/second."""
-        return self.upload_speed / (1024 * 1024)
+        return self.upload_speed / _MIB
 
     @property
     def progress_percent(self) -> float:
@@ -55,9 +63,10 @@ class UploadStats:
     @property
     def eta_seconds(self) -> float:
         """Get estimated time to completion in seconds."""
-        if self.upload_speed > 0:
+        speed = self.upload_speed
+        if speed > 0:
             remaining_bytes = self.total_bytes - self.uploaded_bytes
-            return remaining_bytes / self.upload_speed
+            return remaining_bytes / speed
         return 0.0
 
     @property
@@ -1,23 +1,355 @@
 """TUS protocol uploader for fine-grained upload control."""
 
-import base64
+import binascii
+import contextlib
+import functools
 import hashlib
+import io
+import mmap
 import os
+import queue
+import random
+import socket
 import ssl
+import stat
 import threading
+import time
 from threading import Lock
-from typing import IO, Callable, Optional, Union
+from typing import IO, Any, Callable, Optional, Union
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
+from resumable_upload.client.connection import ConnectionPool
 from resumable_upload.client.stats import UploadStats
 from resumable_upload.exceptions import TusCommunicationError, TusUploadFailed
 
 
+def _get_hash_factory(algorithm: str) -> Callable[..., Any]:
+    """Return a hashlib constructor for a TUS checksum algorithm name (e.g. "sha1").
+
+    Checksums only guard against corruption, so hashers are created with
+    ``usedforsecurity=False``; FIPS-mode OpenSSL builds otherwise reject sha1/md5.
+    """
+    algorithm = algorithm.lower()
+    if algorithm in hashlib.algorithms_guaranteed:
+        # Named constructors (hashlib.sha1, ...) skip hashlib.new's name lookup
+        factory = functools.partial(getattr(hashlib, algorithm), usedforsecurity=False)
+    else:
+        factory = functools.partial(hashlib.new, algorithm, usedforsecurity=False)
+    try:
+        factory().digest()
+    except (ValueError, TypeError) as e:
+        # Unknown to this OpenSSL build, or variable-length (shake_*) digest
+        raise ValueError(f"Unsupported checksum algorithm: {algorithm}") from e
+    return factory
+
+
+# Chunks larger than this are hashed in slices of this size
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Adaptive chunk sizing: aim for PATCH requests of about this duration,
+# changing the size by at most 2x per chunk and staying within the (default) bounds
+_ADAPTIVE_TARGET_SECONDS = 0.5
+_ADAPTIVE_MIN_CHUNK_SIZE = 256 * 1024
+_ADAPTIVE_MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _stat_file_size(file_path: str) -> int:
+    """Return the size of file_path with a single stat call.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    try:
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+
+def _is_seekable(stream: IO) -> bool:
+    """Return whether stream supports seek (objects without seekable() are assumed to)."""
+    seekable = getattr(stream, "seekable", None)
+    return seekable() if seekable is not None else True
+
+
+def _stream_fd(stream: IO) -> Optional[int]:
+    """Return the descriptor of a plain binary file stream on a regular file, else None.
+
+    Only io.FileIO and io.BufferedReader qualify: their bytes are exactly the
+    file's, unlike wrappers such as GzipFile whose fileno() is the compressed file.
+    """
+    if not isinstance(stream, (io.FileIO, io.BufferedReader)):
+        return None
+    try:
+        fd = stream.fileno()
+        return fd if stat.S_ISREG(os.fstat(fd).st_mode) else None
+    except (OSError, ValueError):
+        return None
+
+
+# O_DIRECT reads must start, end and land in memory on block boundaries;
+# 4 KB covers the logical block size of common disks and filesystems
+_DIRECT_IO_ALIGNMENT = 4096
+
+# Without a checksum, chunks larger than this are streamed from the file
+# descriptor instead of being read into memory first
+_STREAM_BODY_MIN_SIZE = 1024 * 1024
+
+# Idle chunk buffers kept for reuse across uploaders, in bytes
+_BUFFER_POOL_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _BufferPool:
+    """Internal: process-wide free list of chunk buffers, keyed by size.
+
+    Uploaders (each part of a parallel upload, successive uploads of one
+    client) take their read buffers from here and hand them back on close,
+    so multi-megabyte bytearrays are not allocated and freed per uploader.
+    Idle buffers are capped at max_bytes in total; extra ones are dropped.
+    """
+
+    def __init__(self, max_bytes: int = _BUFFER_POOL_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._free: dict[int, list[bytearray]] = {}
+        self._idle_bytes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int) -> bytearray:
+        """Return a free buffer of exactly size bytes, or a new one."""
+        with self._lock:
+            buffers = self._free.get(size)
+            if buffers:
+                self._idle_bytes -= size
+                return buffers.pop()
+        return bytearray(size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Keep buffer for a later acquire() if the pool has room."""
+        size = len(buffer)
+        with self._lock:
+            if size and self._idle_bytes + size <= self.max_bytes:
+                self._free.setdefault(size, []).append(buffer)
+                self._idle_bytes += size
+
+
+_BUFFER_POOL = _BufferPool()
+
+
+class _DescriptorFile:
+    """Internal: minimal binary file over a descriptor, for socket.sendfile.
+
+    Positions are absolute file offsets; read() is only used by socket.sendfile
+    when it falls back to send().
+    """
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._pos = 0
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def seek(self, pos: int) -> int:
+        self._pos = pos
+        return pos
+
+    def read(self, size: int) -> bytes:
+        data = os.pread(self._fd, size, self._pos)
+        self._pos += len(data)
+        return data
+
+
+class _RangeFileReader:
+    """Internal: file-like view of [start, start + length) of a descriptor.
+
+    Passed as a request body so the chunk goes from the page cache to the
+    socket (sendfile on plain HTTP, os.pread blocks otherwise) instead of
+    being held in memory.
+    len() is the range length, so it stands in for chunk bytes in the upload
+    loop; seek(0) rewinds it for a retry. Also used as the file_stream of each
+    part of a parallel upload; reads never move a shared file position, so
+    several readers can share one descriptor across threads.
+    """
+
+    def __init__(self, fd: int, start: int, length: int):
+        self._fd = fd
+        self._start = start
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            pos += self._pos
+        elif whence == os.SEEK_END:
+            pos += self._length
+        self._pos = pos
+        return pos
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._length - self._pos
+        if size < 0 or size > remaining:
+            size = remaining
+        if size == 0:
+            return b""
+        data = os.pread(self._fd, size, self._start + self._pos)
+        if not data:
+            raise OSError(f"Unexpected end of file at offset {self._start + self._pos}")
+        self._pos += len(data)
+        return data
+
+    def sendfile(self, sock: socket.socket) -> None:
+        """Send the rest of the range to sock without copying it through Python."""
+        remaining = self._length - self._pos
+        self._pos += sock.sendfile(_DescriptorFile(self._fd), self._start + self._pos, remaining)
+        if self._pos < self._length:
+            raise OSError(f"Unexpected end of file at offset {self._start + self._pos}")
+
+
 class _OffsetMismatch(Exception):
     """Internal: server returned 409 — caller must re-sync offset before retrying."""
 
 
+class _ChunkPrefetcher:
+    """Internal: background thread that reads chunks ahead of the upload loop.
+
+    Reads [start, end) sequentially in chunk_size() pieces into a bounded queue so
+    the next chunk is already in memory while the current PATCH is in flight.
+    The chunk checksum is computed here too, so hashing also overlaps the send
+    (hashlib releases the GIL for large buffers).
+
+    With read_into, chunks are read into a fixed pool of depth + 2 reusable
+    buffers (queued, being sent, being filled) instead of fresh bytes objects;
+    a chunk returned by get() is then only valid until the next get(). Every
+    free buffer is filled by the same vectored read (one preadv for several
+    chunks).
+    """
+
+    def __init__(
+        self,
+        read_chunk: Callable[[int, int], bytes],
+        compute_checksum: Callable[[bytes], Optional[str]],
+        start: int,
+        end: int,
+        chunk_size: Callable[[], int],
+        depth: int,
+        read_into: Optional[Callable[[list[memoryview], int], int]] = None,
+    ):
+        self._read_chunk = read_chunk
+        self._read_into = read_into
+        self._compute_checksum = compute_checksum
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        # Free buffers; empty ones are grown to the chunk size on first use
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(depth + 2):
+            self._free.put(bytearray())
+        self._held: Optional[bytearray] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(start, end, chunk_size), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, start: int, end: int, chunk_size: Callable[[], int]) -> None:
+        offset = start
+        try:
+            while offset < end and not self._stop.is_set():
+                size = min(chunk_size(), end - offset)
+                if self._read_into is not None:
+                    batch = self._take_buffers(size, end - offset)
+                    if not batch:
+                        return
+                    remaining = self._read_into([view for _, view in batch], offset)
+                    if not remaining:
+                        break
+                    for buffer, view in batch:
+                        data = view[:remaining]
+                        if not data:
+                            # Short read; the loop reads on from the new offset
+                            self._free.put(buffer)
+                            continue
+                        remaining -= len(data)
+                        self._put((offset, data, self._compute_checksum(data), None, buffer))
+                        offset += len(data)
+                    continue
+                data = self._read_chunk(offset, size)
+                if not data:
+                    break
+                self._put((offset, data, self._compute_checksum(data), None, None))
+                offset += len(data)
+            # Empty sentinel so the consumer never blocks past the last chunk read
+            self._put((offset, b"", None, None, None))
+        except Exception as e:
+            self._put((offset, b"", None, e, None))
+
+    def _take_buffers(self, size: int, limit: int) -> list[tuple[bytearray, memoryview]]:
+        """Wait for a free buffer, then take all others free too, up to limit bytes.
+
+        Returns (buffer, view) pairs sized for one chunk each; empty once close()
+        is called.
+        """
+        batch: list[tuple[bytearray, memoryview]] = []
+        while not batch and not self._stop.is_set():
+            try:
+                buffer = self._free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            while True:
+                length = min(size, limit)
+                if len(buffer) < length:
+                    _BUFFER_POOL.release(buffer)
+                    buffer = _BUFFER_POOL.acquire(size)
+                batch.append((buffer, memoryview(buffer)[:length]))
+                limit -= length
+                if limit <= 0:
+                    break
+                try:
+                    buffer = self._free.get_nowait()
+                except queue.Empty:
+                    break
+        return batch
+
+    def _put(self, item: tuple) -> None:
+        # Bounded put that gives up once close() is called
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def get(self) -> tuple[int, Union[bytes, memoryview], Optional[str]]:
+        """Return the next (offset, data, checksum) tuple, re-raising any read error.
+
+        Hands the buffer of the previously returned chunk back to the pool.
+        """
+        if self._held is not None:
+            self._free.put(self._held)
+            self._held = None
+        offset, data, checksum, error, self._held = self._queue.get()
+        if error is not None:
+            raise error
+        return offset, data, checksum
+
+    def close(self) -> None:
+        """Stop the reader thread, wait for it to exit and release its buffers."""
+        self._stop.set()
+        self._thread.join()
+        buffers = [self._held]
+        self._held = None
+        while not self._free.empty():
+            buffers.append(self._free.get_nowait())
+        while not self._queue.empty():
+            buffers.append(self._queue.get_nowait()[4])
+        for buffer in buffers:
+            if buffer is not None:
+                _BUFFER_POOL.release(buffer)
+
+
 class Uploader:
     """TUS protocol uploader for fine-grained upload control.
 
@@ -30,7 +362,7 @@ class Uploader:
         >>> uploader = Uploader(
         ...     file_path="file.bin",
         ...     url="http://localhost:8080/files/abc123",
-        ...     chunk_size=1024 * 1024,
+        ...     chunk_size=8 * 1024 * 1024,
         ...     headers={"Authorization": "Bearer token"},
         ... )
         >>> uploader.upload_chunk()  # Upload single chunk
@@ -49,7 +381,7 @@ class Uploader:
         url: str,
         file_path: Optional[str] = None,
         file_stream: Optional[IO] = None,
-        chunk_size: Union[int, float] = 1024 * 1024,
+        chunk_size: Union[int, float] = 8 * 1024 * 1024,
         checksum: bool = True,
         metadata_encoding: str = "utf-8",
         headers: Optional[dict[str, str]] = None,
@@ -58,6 +390,19 @@ class Uploader:
         ssl_context: Optional[ssl.SSLContext] = None,
         timeout: float = 30.0,
         stop_event: Optional[threading.Event] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        prefetch_chunks: int = 0,
+        checksum_algorithm: str = "sha1",
+        retry_max_delay: float = 60.0,
+        retry_jitter: float = 0.1,
+        progress_interval: float = 0.0,
+        adaptive_chunk_size: bool = False,
+        use_mmap: bool = False,
+        offset: Optional[int] = None,
+        direct_io: bool = False,
+        file_size: Optional[int] = None,
+        min_chunk_size: int = _ADAPTIVE_MIN_CHUNK_SIZE,
+        max_chunk_size: int = _ADAPTIVE_MAX_CHUNK_SIZE,
     ):
         """Initialize TUS uploader.
 
@@ -65,7 +410,7 @@ class Uploader:
             url: Upload URL (must already exist on server)
             file_path: Path to file to upload (required if file_stream not provided)
             file_stream: File stream to upload (alternative to file_path)
-            chunk_size: Size of upload chunks in bytes (default: 1MB)
+            chunk_size: Size of upload chunks in bytes (default: 8MB)
             checksum: Enable checksum verification (default: True)
             metadata_encoding: Encoding for metadata values (default: utf-8)
             headers: Optional custom headers to include in all requests
@@ -74,56 +419,170 @@ class Uploader:
             ssl_context: Optional SSL context for TLS connections
             timeout: Request timeout in seconds (default: 30.0)
             stop_event: Optional threading.Event; when set, retry waits are interrupted
+            connection_pool: Optional shared ConnectionPool (default: a private pool
+                closed together with the uploader)
+            prefetch_chunks: Number of chunks read ahead in a background thread during
+                upload() so disk reads overlap network sends (default: 0, disabled)
+            checksum_algorithm: hashlib algorithm used for Upload-Checksum (default: sha1).
+                The server must support it (see Tus-Checksum-Algorithm).
+            retry_max_delay: Upper bound for the exponential backoff delay in seconds
+                (default: 60.0)
+            retry_jitter: Random +/- fraction applied to each backoff delay so many
+                clients don't retry in lockstep (default: 0.1)
+            progress_interval: Minimum seconds between progress_callback calls in
+                upload(); the final chunk always reports (default: 0.0, every chunk)
+            adaptive_chunk_size: Let upload() scale the PATCH size from chunk_size
+                toward ~0.5 s per request, between min_chunk_size and max_chunk_size
+                (default: False)
+            use_mmap: Map file_path read-only and send chunks as zero-copy slices of
+                the mapping instead of reading them (default: False). The file must
+                not be truncated while the uploader is open.
+            offset: Server offset already known to the caller, e.g. from the
+                creation response; skips the initial HEAD request (default: None,
+                ask the server)
+            direct_io: Read file_path with O_DIRECT so a large upload does not
+                fill the page cache (default: False). Linux only; falls back to
+                normal reads where unsupported. Ignored with use_mmap.
+            file_size: Size of file_stream in bytes; skips measuring it by seeking
+                to the end. Required for non-seekable streams (pipes, sockets),
+                which are read strictly sequentially from their current position.
+            min_chunk_size: Smallest PATCH size adaptive_chunk_size may pick
+                (default: 256 KB)
+            max_chunk_size: Largest PATCH size adaptive_chunk_size may pick
+                (default: 16 MB)
 
         Raises:
-            ValueError: If neither file_path nor file_stream provided, or chunk_size < 1
+            ValueError: If neither file_path nor file_stream provided, chunk_size < 1,
+                checksum_algorithm is not supported by hashlib, a non-seekable
+                file_stream is given without file_size, or the chunk size bounds
+                are invalid
         """
         if not file_path and not file_stream:
             raise ValueError("Either file_path or file_stream must be provided")
+        seekable = file_stream is None or _is_seekable(file_stream)
+        if not seekable and file_size is None:
+            raise ValueError("file_size is required for a non-seekable file_stream")
 
-        if file_path and not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # One stat both checks existence and gives the size
+        path_size = _stat_file_size(file_path) if file_path else None
 
         if chunk_size < 1:
             raise ValueError(f"chunk_size must be at least 1 byte, got {chunk_size}")
+        if not 1 <= min_chunk_size <= max_chunk_size:
+            raise ValueError(
+                f"Invalid adaptive chunk size bounds: {min_chunk_size}..{max_chunk_size}"
+            )
 
         self.url = url
         self.file_path = file_path
         self.file_stream = file_stream
         self.chunk_size = int(chunk_size)
+        self.adaptive_chunk_size = adaptive_chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        # Bytes sent per PATCH in upload(); only differs from chunk_size when adaptive
+        self._send_size = self.chunk_size
         self.checksum = checksum
+        self.checksum_algorithm = checksum_algorithm.lower()
+        self._hash_factory = _get_hash_factory(self.checksum_algorithm)
+        # Copying a fresh hasher skips the digest context setup of a constructor call
+        self._hash_template = self._hash_factory()
+        # Upload-Checksum prefix as bytes, joined with the base64 digest before one decode
+        self._checksum_prefix = f"{self.checksum_algorithm} ".encode("ascii")
         self.metadata_encoding = metadata_encoding
         self.headers = headers or {}
+        # Invariant PATCH headers, refreshed per upload()/upload_chunk() call
+        self._patch_headers = self._base_patch_headers()
+        # (value, str(value)) of the last Upload-Offset/Content-Length sent; full
+        # chunks repeat the length and the server's Upload-Offset is reused as-is
+        self._offset_str: tuple[int, str] = (0, "0")
+        self._length_str: tuple[int, str] = (0, "0")
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
         self.ssl_context = ssl_context
         self.timeout = timeout
+        self.prefetch_chunks = prefetch_chunks
+        self.progress_interval = progress_interval
         self._stop_event = stop_event or threading.Event()
+        # Keep-alive connections avoid a TCP/TLS handshake per chunk
+        self._owns_pool = connection_pool is None
+        self._pool = connection_pool or ConnectionPool(ssl_context=ssl_context, timeout=timeout)
 
         # Initialize file stream and get file size
         if file_stream:
             self._file_handle = file_stream
             self._owns_file = False
-            file_stream.seek(0, os.SEEK_END)
-            self.file_size = file_stream.tell()
-            file_stream.seek(0)
+            if file_size is None:
+                file_stream.seek(0, os.SEEK_END)
+                file_size = file_stream.tell()
+                file_stream.seek(0)
+            self.file_size = file_size
         else:
-            self._file_handle = open(file_path, "rb")  # noqa: SIM115
+            # Unbuffered: chunk reads are far larger than a BufferedReader's 8 KB
+            # buffer, which would only add a copy for reads it cannot bypass
+            self._file_handle = open(file_path, "rb", buffering=0)  # noqa: SIM115
             self._owns_file = True
-            self.file_size = os.path.getsize(file_path)
+            self.file_size = path_size
+
+        # Positional reads on the descriptor avoid a seek per chunk (POSIX only).
+        # A range reader stream (one part of a parallel upload) is read through
+        # its descriptor too, with file offsets shifted by the range start, and
+        # so is a file_stream that is a plain binary file.
+        self._fd: Optional[int] = None
+        self._fd_base = 0
+        if hasattr(os, "pread"):
+            if self._owns_file:
+                self._fd = self._file_handle.fileno()
+            elif isinstance(file_stream, _RangeFileReader):
+                self._fd, self._fd_base = file_stream._fd, file_stream._start
+            elif seekable:
+                self._fd = _stream_fd(file_stream)
+        # Reusable chunk buffer for reads on the upload thread (see _read_chunk_reuse),
+        # taken from and returned to the shared _BUFFER_POOL
+        self._buffer: Optional[bytearray] = None
+        # Chunks become views into the page cache; empty files cannot be mapped
+        self._mmap: Optional[mmap.mmap] = None
+        if use_mmap and self._owns_file and self.file_size > 0:
+            self._mmap = mmap.mmap(self._file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Chunks are sliced front to back: read ahead aggressively, drop behind
+                with contextlib.suppress(OSError):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        # Second descriptor opened with O_DIRECT, plus its page-aligned read buffer
+        self._direct_fd: Optional[int] = None
+        self._direct_buffer: Optional[mmap.mmap] = None
+        if direct_io and self._mmap is None and self._owns_file and self._fd is not None:
+            self._direct_fd = self._open_direct(file_path)
+        # Reads through the page cache are sequential: ask for a larger readahead
+        self._fadvise = (
+            hasattr(os, "posix_fadvise")
+            and self._fd is not None
+            and self._mmap is None
+            and self._direct_fd is None
+        )
+        if self._fadvise:
+            self._advise(0, self.file_size, os.POSIX_FADV_SEQUENTIAL)
 
         # Statistics tracking (must be after file_size is set)
         self._stats = UploadStats(total_bytes=self.file_size)
         self.stats_lock = Lock()
 
-        # Get current offset from server; close file handle on failure
+        # Get current offset from server unless the caller already knows it;
+        # close file handle on failure
         try:
-            self.offset = self._get_offset()
+            self.offset = self._get_offset() if offset is None else offset
         except Exception:
-            if self._owns_file:
-                self._file_handle.close()
+            self.close()
             raise
-        self._file_handle.seek(self.offset)
+        # Stream position as last left by _read_chunk; sequential reads skip the seek
+        self._stream_pos = self.offset
+        if seekable:
+            self._file_handle.seek(self.offset)
+        elif self.offset:
+            self.close()
+            raise ValueError(f"Cannot resume a non-seekable file_stream at offset {self.offset}")
 
         # Initialize stats with current offset (for already started uploads)
         self._update_stats_after_chunk()
@@ -137,9 +596,28 @@ class Uploader:
         self.close()
 
     def close(self) -> None:
-        """Close the file handle if we own it."""
+        """Close the file handle and connection pool if we own them."""
+        self._close_direct()
+        if self._mmap is not None:
+            # A chunk view still referenced elsewhere keeps the mapping alive until released
+            with contextlib.suppress(BufferError):
+                self._mmap.close()
+            self._mmap = None
         if self._owns_file and self._file_handle and not self._file_handle.closed:
             self._file_handle.close()
+        if self._buffer is not None:
+            _BUFFER_POOL.release(self._buffer)
+            self._buffer = None
+        if self._owns_pool:
+            self._pool.close()
+
+    def _base_patch_headers(self) -> dict[str, str]:
+        """Return the PATCH headers that stay the same for every chunk."""
+        return {
+            "Tus-Resumable": self.TUS_VERSION,
+            "Content-Type": "application/offset+octet-stream",
+            **self.headers,
+        }
 
     def _get_offset(self) -> int:
         """Get the current upload offset from server."""
@@ -149,55 +627,212 @@ class Uploader:
         }
 
         try:
-            req = Request(self.url, headers=headers, method="HEAD")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                offset = response.headers.get("Upload-Offset")
-                if offset is None:
-                    raise TusCommunicationError("Server did not return Upload-Offset header")
-                return int(offset)
+            response = self._pool.request("HEAD", self.url, headers=headers)
         except (HTTPError, URLError) as e:
             raise TusCommunicationError(
                 f"Failed to get offset: {str(e)}",
             ) from e
 
-    def _upload_chunk(self, data: bytes) -> None:
+        offset = response.headers.get("Upload-Offset")
+        if offset is None:
+            raise TusCommunicationError("Server did not return Upload-Offset header")
+        return int(offset)
+
+    @staticmethod
+    def _open_direct(file_path: str) -> Optional[int]:
+        """Open file_path with O_DIRECT, or return None if that is not supported."""
+        if not hasattr(os, "O_DIRECT") or not hasattr(os, "preadv"):
+            return None
+        try:
+            return os.open(file_path, os.O_RDONLY | os.O_DIRECT)
+        except OSError:
+            # e.g. EINVAL on tmpfs and other filesystems without direct I/O
+            return None
+
+    def _close_direct(self) -> None:
+        """Close the O_DIRECT descriptor and buffer; later reads use the normal path."""
+        if self._direct_fd is not None:
+            os.close(self._direct_fd)
+            self._direct_fd = None
+        if self._direct_buffer is not None:
+            # A chunk view still referenced elsewhere keeps the buffer alive until released
+            with contextlib.suppress(BufferError):
+                self._direct_buffer.close()
+            self._direct_buffer = None
+
+    def _read_direct(self, offset: int, size: int) -> Optional[memoryview]:
+        """Read via O_DIRECT into the aligned buffer; None if direct I/O failed.
+
+        Reads the block-aligned range around [offset, offset + size) and returns
+        a view of the requested bytes, valid until the next call.
+        """
+        start = offset - offset % _DIRECT_IO_ALIGNMENT
+        end = -(-(offset + size) // _DIRECT_IO_ALIGNMENT) * _DIRECT_IO_ALIGNMENT
+        length = end - start
+        if self._direct_buffer is None or len(self._direct_buffer) < length:
+            # Anonymous mappings are page aligned, as O_DIRECT requires. The old
+            # buffer is unmapped once the last chunk view into it is released.
+            self._direct_buffer = mmap.mmap(-1, length)
+        buffer = memoryview(self._direct_buffer)
+        try:
+            read = os.preadv(self._direct_fd, [buffer[:length]], start)
+        except OSError:
+            buffer.release()
+            self._close_direct()
+            return None
+        head = offset - start
+        return buffer[head : head + max(0, min(size, read - head))]
+
+    def _read_chunk(self, offset: int, size: int) -> Union[bytes, memoryview]:
+        """Read up to size bytes of the file starting at offset."""
+        if self._direct_fd is not None:
+            view = self._read_direct(offset, size)
+            if view is not None:
+                # Callers may keep the chunk (prefetch queue); copy out of the buffer
+                return bytes(view)
+        if self._mmap is not None:
+            return memoryview(self._mmap)[offset : offset + size]
+        if self._fd is not None:
+            return os.pread(self._fd, size, self._fd_base + offset)
+        if offset != self._stream_pos:
+            self._file_handle.seek(offset)
+        data = self._file_handle.read(size)
+        self._stream_pos = offset + len(data)
+        return data
+
+    def _can_read_into(self) -> bool:
+        """Return whether chunks can be read into caller buffers.
+
+        That is with os.preadv on the descriptor, or readinto() on a binary
+        file_stream without one.
+        """
+        if self._direct_fd is not None or self._mmap is not None:
+            return False
+        if self._fd is not None:
+            return hasattr(os, "preadv")
+        return hasattr(self._file_handle, "readinto")
+
+    def _read_into(self, views: list[memoryview], offset: int) -> int:
+        """Fill views in order from the file at offset; return the number of bytes read."""
+        if self._fd is not None:
+            return os.preadv(self._fd, views, self._fd_base + offset)
+        if offset != self._stream_pos:
+            self._file_handle.seek(offset)
+        total = 0
+        for view in views:
+            read = self._file_handle.readinto(view) or 0
+            total += read
+            if read < len(view):
+                break
+        self._stream_pos = offset + total
+        return total
+
+    def _read_chunk_reuse(self, offset: int, size: int) -> Union[bytes, memoryview]:
+        """Like _read_chunk, but read into one buffer reused across chunks.
+
+        Avoids allocating a new bytes object per chunk. The returned view is only
+        valid until the next call, so this is used only where the chunk is fully
+        sent before the next read (the prefetch thread keeps its own buffer pool).
+        """
+        if self._direct_fd is not None:
+            view = self._read_direct(offset, size)
+            if view is not None:
+                return view
+        if not self._can_read_into():
+            return self._read_chunk(offset, size)
+        if self._buffer is None or len(self._buffer) < size:
+            if self._buffer is not None:
+                _BUFFER_POOL.release(self._buffer)
+            self._buffer = _BUFFER_POOL.acquire(size)
+        view = memoryview(self._buffer)[:size]
+        return view[: self._read_into([view], offset)]
+
+    def _advise(self, offset: int, length: int, advice: int) -> None:
+        """posix_fadvise a range of the upload's data (best effort)."""
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(self._fd, self._fd_base + offset, length, advice)
+
+    def _chunk_body(self, offset: int, size: int) -> Union[bytes, memoryview, _RangeFileReader]:
+        """Return the PATCH body for a chunk read on the upload thread.
+
+        Large chunks are streamed from the descriptor when no checksum has to
+        be computed up front (the Upload-Checksum header precedes the body);
+        everything else is read via _read_chunk_reuse. The next chunk is
+        requested from disk in the background while this one is sent.
+        """
+        if self._fadvise and offset + size < self.file_size:
+            self._advise(offset + size, size, os.POSIX_FADV_WILLNEED)
+        if (
+            not self.checksum
+            and size > _STREAM_BODY_MIN_SIZE
+            and self._fd is not None
+            and self._mmap is None
+            and self._direct_fd is None
+        ):
+            return _RangeFileReader(self._fd, self._fd_base + offset, size)
+        return self._read_chunk_reuse(offset, size)
+
+    def _compute_checksum(self, data: bytes) -> Optional[str]:
+        """Return the Upload-Checksum header value for data, or None if disabled."""
+        if not self.checksum:
+            return None
+        hasher = self._hash_template.copy()
+        if len(data) <= _HASH_BLOCK_SIZE:
+            hasher.update(data)
+        else:
+            # Feed very large chunks incrementally via zero-copy slices so each
+            # update call (and any GIL hold around it) stays bounded
+            view = memoryview(data)
+            for start in range(0, len(view), _HASH_BLOCK_SIZE):
+                hasher.update(view[start : start + _HASH_BLOCK_SIZE])
+        encoded = binascii.b2a_base64(hasher.digest(), newline=False)
+        return (self._checksum_prefix + encoded).decode("ascii")
+
+    def _upload_chunk(self, data: bytes, checksum: Optional[str] = None) -> None:
         """Upload a chunk of data with optional retry logic.
 
         After successful upload, self.offset will be updated.
         Stats are automatically updated after successful upload.
+
+        Args:
+            data: Chunk bytes
+            checksum: Precomputed Upload-Checksum value (computed here if None)
         """
+        # Hash once per chunk; retries reuse the same checksum
+        if checksum is None:
+            checksum = self._compute_checksum(data)
         if self.max_retries > 0:
-            self._upload_chunk_with_retry(data)
+            self._upload_chunk_with_retry(data, checksum)
         else:
-            self._upload_chunk_once(data)
+            self._upload_chunk_once(data, checksum)
             # Update stats after successful upload
             self._update_stats_after_chunk()
 
-    def _upload_chunk_once(self, data: bytes) -> None:
-        """Upload a chunk of data (single attempt)."""
-        headers = {
-            "Tus-Resumable": self.TUS_VERSION,
-            "Upload-Offset": str(self.offset),
-            "Content-Type": "application/offset+octet-stream",
-            "Content-Length": str(len(data)),
-            **self.headers,
-        }
+    def _upload_chunk_once(
+        self, data: Union[bytes, memoryview, _RangeFileReader], checksum: Optional[str] = None
+    ) -> None:
+        """Upload a chunk of data (single attempt).
 
-        # Add checksum if enabled
-        if self.checksum:
-            checksum_bytes = hashlib.sha1(data).digest()
-            checksum_b64 = base64.b64encode(checksum_bytes).decode("ascii")
-            headers["Upload-Checksum"] = f"sha1 {checksum_b64}"
+        Args:
+            data: Chunk bytes, or a range reader streamed from the file
+            checksum: Precomputed Upload-Checksum header value, if any
+        """
+        if isinstance(data, _RangeFileReader):
+            # A previous attempt may have consumed part of the stream
+            data.seek(0)
+        offset, size = self.offset, len(data)
+        if self._offset_str[0] != offset:
+            self._offset_str = (offset, str(offset))
+        if self._length_str[0] != size:
+            self._length_str = (size, str(size))
+        headers = self._patch_headers.copy()
+        headers["Upload-Offset"] = self._offset_str[1]
+        headers["Content-Length"] = self._length_str[1]
+        if checksum:
+            headers["Upload-Checksum"] = checksum
 
         try:
-            req = Request(self.url, data=data, headers=headers, method="PATCH")
-            with urlopen(req, context=self.ssl_context, timeout=self.timeout) as response:
-                # Update offset from server response
-                new_offset = response.headers.get("Upload-Offset")
-                if new_offset:
-                    self.offset = int(new_offset)
-                else:
-                    self.offset += len(data)
+            response = self._pool.request("PATCH", self.url, headers=headers, body=data)
         except HTTPError as e:
             if e.code == 409:
                 raise _OffsetMismatch(
@@ -211,13 +846,28 @@ class Uploader:
                 f"Failed to upload chunk at offset {self.offset}: {e}",
             ) from e
 
-    def _update_stats_after_chunk(self) -> None:
+        # Update offset from server response
+        new_offset = response.headers.get("Upload-Offset")
+        if new_offset:
+            self.offset = int(new_offset)
+            self._offset_str = (self.offset, new_offset)
+        else:
+            self.offset += len(data)
+
+    def _update_stats_after_chunk(self, retried: bool = False) -> None:
         """Update statistics after a chunk is successfully uploaded.
 
         This method should be called after self.offset has been updated
-        to reflect the new upload position.
+        to reflect the new upload position. Stats are only written from the
+        uploading thread; the lock just keeps snapshots read via ``stats``
+        coherent, so it is taken once per chunk.
+
+        Args:
+            retried: Whether the chunk needed at least one retry
         """
         with self.stats_lock:
+            if retried:
+                self._stats.chunks_retried += 1
             # uploaded_bytes should always match offset
             self._stats.uploaded_bytes = self.offset
 
@@ -226,28 +876,33 @@ class Uploader:
             # offset=0 means 0 chunks, offset=chunk_size means 1 chunk, etc.
             self._stats.chunks_completed = self.offset // self.chunk_size
 
-    def _upload_chunk_with_retry(self, data: bytes) -> None:
-        """Upload a chunk of data with retry logic."""
-        last_error: Optional[Exception] = None
+    def _adapt_chunk_size(self, sent: int, elapsed: float) -> None:
+        """Scale the next PATCH size so a request takes about _ADAPTIVE_TARGET_SECONDS."""
+        factor = _ADAPTIVE_TARGET_SECONDS / elapsed if elapsed > 0 else 2.0
+        factor = min(max(factor, 0.5), 2.0)
+        self._send_size = int(min(max(sent * factor, self.min_chunk_size), self.max_chunk_size))
 
+    def _retry_backoff(self, attempt: int) -> float:
+        """Return the delay before retry number attempt + 1."""
+        delay = min(self.retry_delay * (2**attempt), self.retry_max_delay)
+        if self.retry_jitter:
+            delay *= 1 + random.uniform(-self.retry_jitter, self.retry_jitter)
+        return delay
+
+    def _upload_chunk_with_retry(self, data: bytes, checksum: Optional[str] = None) -> None:
+        """Upload a chunk of data with retry logic."""
         for attempt in range(self.max_retries + 1):  # +1 for initial attempt
             try:
-                self._upload_chunk_once(data)
-                # Track retry if this was a retry attempt
-                if attempt > 0:
-                    with self.stats_lock:
-                        self._stats.chunks_retried += 1
-                # Update stats after successful upload
-                self._update_stats_after_chunk()
+                self._upload_chunk_once(data, checksum)
+                # Update stats (and retry count, if this was a retry) after successful upload
+                self._update_stats_after_chunk(retried=attempt > 0)
                 return  # Success
             except _OffsetMismatch:
                 raise  # Don't retry 409; caller must re-sync offset via HEAD
             except (TusUploadFailed, OSError) as e:
-                last_error = e
                 if attempt < self.max_retries:
-                    # Exponential backoff capped at 60 seconds; interruptible via stop_event
-                    delay = min(self.retry_delay * (2**attempt), 60.0)
-                    if self._stop_event.wait(timeout=delay):
+                    # Capped exponential backoff with jitter; interruptible via stop_event
+                    if self._stop_event.wait(timeout=self._retry_backoff(attempt)):
                         raise TusUploadFailed("Upload cancelled via stop_event") from e
                 else:
                     # All retries failed
@@ -258,10 +913,6 @@ class Uploader:
                         f"after {self.max_retries + 1} attempts: {str(e)}",
                     ) from e
 
-        # Should not reach here, but just in case
-        error_msg = str(last_error) if last_error else "Unknown error"
-        raise TusUploadFailed(f"Failed to upload chunk at offset {self.offset}: {error_msg}")
-
     def upload_chunk(self) -> bool:
         """Upload a single chunk.
 
@@ -274,10 +925,10 @@ class Uploader:
         if self.offset >= self.file_size:
             return False
 
+        self._patch_headers = self._base_patch_headers()
         # Read chunk
         chunk_size = min(self.chunk_size, self.file_size - self.offset)
-        self._file_handle.seek(self.offset)
-        chunk = self._file_handle.read(chunk_size)
+        chunk = self._chunk_body(self.offset, chunk_size)
 
         if not chunk:
             raise OSError(
@@ -291,7 +942,6 @@ class Uploader:
         except _OffsetMismatch:
             # Server offset diverged (409); re-sync via HEAD
             self.offset = self._get_offset()
-            self._file_handle.seek(self.offset)
 
         return self.offset < self.file_size
 
@@ -313,29 +963,68 @@ class Uploader:
             TusUploadFailed: If upload fails
         """
         max_offset = min(stop_at, self.file_size) if stop_at is not None else self.file_size
+        prefetcher: Optional[_ChunkPrefetcher] = None
+        last_progress = float("-inf")
+        # Pick up changes to self.headers once, not per chunk
+        self._patch_headers = self._base_patch_headers()
+        # Loop-invariant lookups bound once (matters for many small chunks)
+        monotonic = time.monotonic
+        upload_chunk = self._upload_chunk
+        prefetch_depth = self.prefetch_chunks
+        adaptive = self.adaptive_chunk_size
+        progress_interval = self.progress_interval
 
-        while self.offset < max_offset:
-            chunk_size = min(self.chunk_size, max_offset - self.offset)
-            self._file_handle.seek(self.offset)
-            chunk = self._file_handle.read(chunk_size)
+        try:
+            while self.offset < max_offset:
+                if prefetch_depth > 0:
+                    if prefetcher is None:
+                        prefetcher = _ChunkPrefetcher(
+                            self._read_chunk,
+                            self._compute_checksum,
+                            self.offset,
+                            max_offset,
+                            lambda: self._send_size,
+                            prefetch_depth,
+                            self._read_into if self._can_read_into() else None,
+                        )
+                    chunk_offset, chunk, checksum = prefetcher.get()
+                    if chunk_offset != self.offset:
+                        # Offset moved unexpectedly; restart read-ahead from the new offset
+                        prefetcher.close()
+                        prefetcher = None
+                        continue
+                else:
+                    chunk_size = min(self._send_size, max_offset - self.offset)
+                    chunk = self._chunk_body(self.offset, chunk_size)
+                    checksum = None
 
-            if not chunk:
-                raise OSError(
-                    f"Unexpected end of file at offset {self.offset} "
-                    f"(file size reported as {self.file_size} bytes)"
-                )
+                if not chunk:
+                    raise OSError(
+                        f"Unexpected end of file at offset {self.offset} "
+                        f"(file size reported as {self.file_size} bytes)"
+                    )
 
-            try:
-                # Upload chunk (stats are automatically updated inside _upload_chunk)
-                self._upload_chunk(chunk)
-            except _OffsetMismatch:
-                # Server offset diverged (409); re-sync via HEAD and retry chunk
-                self.offset = self._get_offset()
-                self._file_handle.seek(self.offset)
-                continue
+                try:
+                    # Upload chunk (stats are automatically updated inside _upload_chunk)
+                    started = monotonic()
+                    upload_chunk(chunk, checksum)
+                except _OffsetMismatch:
+                    # Server offset diverged (409); re-sync via HEAD and retry chunk
+                    self.offset = self._get_offset()
+                    continue
+
+                if adaptive:
+                    self._adapt_chunk_size(len(chunk), monotonic() - started)
 
-            if progress_callback:
-                progress_callback(self.stats)
+                if progress_callback:
+                    # Throttle callbacks (often a print per call) on small-chunk uploads
+                    now = monotonic()
+                    if now - last_progress >= progress_interval or self.offset >= max_offset:
+                        last_progress = now
+                        progress_callback(self.stats)
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
 
         return self.url
 
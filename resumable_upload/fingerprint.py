@@ -6,7 +6,10 @@ Uses SHA-256 hash + file size to generate unique fingerprints for resumable uplo
 
 import hashlib
 import os
-from typing import IO, Union
+from typing import IO, Optional, Union
+
+# Fingerprints of file paths remembered per Fingerprint instance
+_CACHE_SIZE = 256
 
 
 class Fingerprint:
@@ -15,10 +18,31 @@ class Fingerprint:
 
     Uses SHA-256 hash of file content combined with file size to create
     a unique identifier for each file.
+
+    Fingerprints of file paths are cached on the file's stat identity (device,
+    inode, size, mtime), so fingerprinting an unchanged file again skips the
+    re-hash.
     """
 
     BLOCK_SIZE = 65536  # 64KB blocks for hashing
 
+    # Class defaults, so subclasses that don't call __init__ keep working
+    sample_size: Optional[int] = None
+    _cache: Optional[dict[tuple, str]] = None
+
+    def __init__(self, sample_size: Optional[int] = None):
+        """Initialize fingerprinter.
+
+        Args:
+            sample_size: Hash only the first and last sample_size bytes of files
+                larger than twice that, giving "size:{size}--sha256s:{hash}"
+                (default: None, hash the full content). Bounds the work for very
+                large files, but two files of equal size that differ only in the
+                middle get the same fingerprint.
+        """
+        self.sample_size = sample_size
+        self._cache: dict[tuple, str] = {}
+
     def get_fingerprint(self, file_source: Union[str, IO]) -> str:
         """
         Generate a unique fingerprint for a file.
@@ -31,8 +55,20 @@ class Fingerprint:
         """
         if isinstance(file_source, str):
             # file_source is a path
-            with open(file_source, "rb") as fs:
-                return self._fingerprint_from_stream(fs)
+            st = os.stat(file_source)
+            # The stat identity alone names the file, whatever path spelling is used
+            key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            if self._cache is None:
+                self._cache = {}
+            fingerprint = self._cache.get(key)
+            if fingerprint is None:
+                # Blocks are read straight into the hash buffer, no BufferedReader copy
+                with open(file_source, "rb", buffering=0) as fs:
+                    fingerprint = self._fingerprint_from_stream(fs)
+                if len(self._cache) >= _CACHE_SIZE:
+                    self._cache.clear()
+                self._cache[key] = fingerprint
+            return fingerprint
         else:
             # file_source is a stream
             original_pos = file_source.tell()
@@ -44,17 +80,40 @@ class Fingerprint:
 
     def _fingerprint_from_stream(self, fs: IO) -> str:
         """Generate fingerprint from file stream."""
+        if self.sample_size:
+            file_size = fs.seek(0, os.SEEK_END)
+            if file_size > 2 * self.sample_size:
+                return self._sampled_fingerprint(fs, file_size)
+
         fs.seek(0)
         hasher = hashlib.sha256()
 
         # Hash full file content in blocks
-        while buf := fs.read(self.BLOCK_SIZE):
-            if isinstance(buf, str):
-                buf = buf.encode("utf-8")
-            hasher.update(buf)
+        if hasattr(fs, "readinto"):
+            # Binary streams: one reused buffer instead of a bytes object per block
+            buffer = bytearray(self.BLOCK_SIZE)
+            view = memoryview(buffer)
+            while n := fs.readinto(buffer):
+                hasher.update(view[:n])
+        else:
+            while buf := fs.read(self.BLOCK_SIZE):
+                if isinstance(buf, str):
+                    buf = buf.encode("utf-8")
+                hasher.update(buf)
 
         # Get file size
         fs.seek(0, os.SEEK_END)
         file_size = fs.tell()
 
         return f"size:{file_size}--sha256:{hasher.hexdigest()}"
+
+    def _sampled_fingerprint(self, fs: IO, file_size: int) -> str:
+        """Fingerprint from the first and last sample_size bytes of the stream."""
+        hasher = hashlib.sha256()
+        for start in (0, file_size - self.sample_size):
+            fs.seek(start)
+            sample = fs.read(self.sample_size)
+            if isinstance(sample, str):
+                sample = sample.encode("utf-8")
+            hasher.update(sample)
+        return f"size:{file_size}--sha256s:{hasher.hexdigest()}"
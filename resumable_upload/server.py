@@ -2,7 +2,9 @@
 
 import base64
 import binascii
+import functools
 import hashlib
+import hmac
 import logging
 import re
 import threading
@@ -10,24 +12,88 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from email.utils import formatdate
 from http.server import BaseHTTPRequestHandler
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional, Union
+from urllib.parse import urlsplit
 
 from resumable_upload.storage import SQLiteStorage, Storage
 
 logger = logging.getLogger(__name__)
 
+# Upload-Checksum only detects corruption: hashing with usedforsecurity=False
+# also works on FIPS-mode OpenSSL builds, which reject sha1 otherwise
+_sha1 = functools.partial(hashlib.sha1, usedforsecurity=False)
+
+# Unread request bodies are discarded in blocks of this size before responding,
+# up to max_size (or _MAX_DRAIN_SIZE without a limit); larger ones close the connection
+_DRAIN_BLOCK_SIZE = 1024 * 1024
+_MAX_DRAIN_SIZE = 64 * 1024 * 1024
+
 _UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
 
 _TUS_EXPOSE_HEADERS = (
     "Upload-Offset,Location,Upload-Length,Tus-Version,Tus-Resumable,"
-    "Tus-Max-Size,Tus-Extension,Upload-Metadata,Upload-Expires"
+    "Tus-Max-Size,Tus-Extension,Upload-Metadata,Upload-Expires,Upload-Concat"
 )
 _TUS_ALLOW_HEADERS = (
     "Origin,X-Requested-With,Content-Type,Upload-Length,Upload-Offset,"
-    "Tus-Resumable,Upload-Metadata,Upload-Checksum,Upload-Expires"
+    "Tus-Resumable,Upload-Metadata,Upload-Checksum,Upload-Expires,Upload-Concat"
 )
 
 
+class _HashingReader:
+    """Internal: file-like wrapper that feeds everything read through a hasher."""
+
+    def __init__(self, stream: BinaryIO, hasher: Any):
+        self._stream = stream
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._hasher.update(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        readinto = getattr(self._stream, "readinto", None)
+        if readinto is None:
+            data = self._stream.read(len(buffer))
+            n = len(data)
+            buffer[:n] = data
+        else:
+            n = readinto(buffer)
+        self._hasher.update(memoryview(buffer)[:n])
+        return n
+
+
+class _LimitedReader:
+    """Internal: reads at most length bytes of a request body from a stream."""
+
+    def __init__(self, stream: BinaryIO, length: int):
+        self._stream = stream
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._stream.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer)
+        if len(view) > self.remaining:
+            view = view[: self.remaining]
+        n = self._stream.readinto(view) if len(view) else 0
+        self.remaining -= n
+        return n
+
+    def drain(self) -> bool:
+        """Read and discard the rest of the body; return whether it ended cleanly."""
+        while self.remaining:
+            if not self.read(_DRAIN_BLOCK_SIZE):
+                return False
+        return True
+
+
 class TusServer:
     """TUS protocol server implementation.
 
@@ -46,6 +112,8 @@ class TusServer:
         - checksum: SHA1 checksum verification
         - expiration: Upload expiration support
         - creation-with-upload: Initial data in POST body
+        - concatenation: Partial uploads combined into a final upload
+          (when the storage backend sets supports_concatenation)
 
     Example:
         >>> storage = SQLiteStorage()
@@ -98,6 +166,11 @@ class TusServer:
         self.request_timeout = request_timeout
         self._last_cleanup: Optional[datetime] = None
         self._cleanup_lock = threading.Lock()
+        # Concatenation needs a backend that can record Upload-Concat
+        self._supports_concat = self.storage.supports_concatenation
+        self.extensions = list(self.SUPPORTED_EXTENSIONS)
+        if self._supports_concat:
+            self.extensions.append("concatenation")
 
     def _validate_upload_id(self, upload_id: str) -> bool:
         """Validate that upload_id is a valid UUID to prevent path traversal."""
@@ -120,8 +193,37 @@ class TusServer:
         """Format expiry datetime as RFC 7231 date string."""
         return formatdate(expires_at.timestamp(), usegmt=True)
 
+    def _body_length(self, headers: dict[str, str], body: Union[bytes, BinaryIO]) -> Optional[int]:
+        """Return the request body size: len(body) for bytes, Content-Length for streams.
+
+        Returns None for a stream without Content-Length, whose size is unknown.
+
+        Raises:
+            ValueError: If a streamed body has an invalid or negative Content-Length
+        """
+        if not hasattr(body, "read"):
+            return len(body)
+        if headers.get("content-length") is None:
+            return None
+        length = int(headers.get("content-length") or 0)
+        if length < 0:
+            raise ValueError(f"Negative Content-Length: {length}")
+        return length
+
+    def _length_required_response(self, headers: dict[str, str]) -> tuple[int, dict, bytes]:
+        """Reject a streamed body sent without Content-Length."""
+        if "transfer-encoding" in headers:
+            logger.error(f"Unsupported Transfer-Encoding: {headers['transfer-encoding']}")
+            return self._error_response(400, "Transfer-Encoding is not supported")
+        logger.error("Missing Content-Length header")
+        return self._error_response(411, "Content-Length required")
+
     def handle_request(
-        self, method: str, path: str, headers: dict[str, str], body: bytes = b""
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: Union[bytes, BinaryIO] = b"",
     ) -> tuple[int, dict[str, str], bytes]:
         """Handle an incoming HTTP request.
 
@@ -129,7 +231,9 @@ class TusServer:
             method: HTTP method
             path: Request path
             headers: Request headers
-            body: Request body
+            body: Request body, either as bytes or as a binary file-like object.
+                A stream is read for Content-Length bytes and copied to storage
+                in blocks, so the body is never held in memory in full.
 
         Returns:
             Tuple of (status_code, response_headers, response_body)
@@ -209,7 +313,7 @@ class TusServer:
         response_headers = {
             "Tus-Resumable": self.TUS_VERSION,
             "Tus-Version": self.TUS_VERSION,
-            "Tus-Extension": ",".join(self.SUPPORTED_EXTENSIONS),
+            "Tus-Extension": ",".join(self.extensions),
             "Tus-Checksum-Algorithm": "sha1",
         }
 
@@ -219,9 +323,27 @@ class TusServer:
         return (204, response_headers, b"")
 
     def _handle_create(
-        self, headers: dict[str, str], body: bytes
+        self, headers: dict[str, str], body: Union[bytes, BinaryIO]
     ) -> tuple[int, dict[str, str], bytes]:
         """Handle POST request to create a new upload."""
+        try:
+            body_length = self._body_length(headers, body)
+        except ValueError:
+            logger.error(f"Invalid Content-Length header: {headers.get('content-length')}")
+            return self._error_response(400, "Invalid Content-Length header")
+        if body_length is None:
+            if headers.get("content-type") == "application/offset+octet-stream":
+                return self._length_required_response(headers)
+            # Plain creation request: no initial data to read
+            body_length = 0
+
+        upload_concat = headers.get("upload-concat", "") if self._supports_concat else ""
+        if upload_concat.startswith("final;"):
+            return self._handle_create_final(headers, upload_concat)
+        if upload_concat and upload_concat != "partial":
+            logger.error(f"Invalid Upload-Concat header: {upload_concat}")
+            return self._error_response(400, "Invalid Upload-Concat header")
+
         upload_length_str = headers.get("upload-length")
         if not upload_length_str:
             logger.error("Missing Upload-Length header")
@@ -241,24 +363,10 @@ class TusServer:
             logger.warning(f"Upload size {upload_length} exceeds maximum {self.max_size}")
             return self._error_response(413, "Upload exceeds maximum size")
 
-        # Parse metadata
-        metadata = {}
-        upload_metadata = headers.get("upload-metadata", "")
-        if upload_metadata:
-            if len(upload_metadata) > self._MAX_METADATA_SIZE:
-                return self._error_response(
-                    400, f"Upload-Metadata exceeds maximum size of {self._MAX_METADATA_SIZE} bytes"
-                )
-            for pair in upload_metadata.split(","):
-                pair = pair.strip()
-                if " " in pair:
-                    key, value = pair.split(" ", 1)
-                    try:
-                        metadata[key] = base64.b64decode(value).decode("utf-8")
-                    except (ValueError, UnicodeDecodeError, binascii.Error) as e:
-                        return self._error_response(
-                            400, f"Invalid base64 encoding for metadata key '{key}': {e}"
-                        )
+        try:
+            metadata = self._parse_metadata(headers)
+        except ValueError as e:
+            return self._error_response(400, str(e))
 
         # Generate upload ID
         upload_id = str(uuid.uuid4())
@@ -270,12 +378,14 @@ class TusServer:
 
         # Create upload
         self.storage.create_upload(upload_id, upload_length, metadata, expires_at)
+        if upload_concat:
+            self.storage.set_upload_concat(upload_id, upload_concat)
         logger.info(f"Created upload {upload_id} with length {upload_length}, metadata: {metadata}")
 
         # Handle creation-with-upload: process initial data if provided
         initial_offset = 0
         content_type = headers.get("content-type", "")
-        if body and content_type != "application/offset+octet-stream":
+        if body_length and content_type != "application/offset+octet-stream":
             # Body present but Content-Type doesn't match — body is silently ignored per TUS spec.
             # Log a warning so developers can catch misconfigurations.
             logger.warning(
@@ -283,9 +393,12 @@ class TusServer:
                 "application/offset+octet-stream; body ignored (not creation-with-upload)",
                 content_type,
             )
-        if body and content_type == "application/offset+octet-stream":
-            self.storage.write_chunk(upload_id, 0, body)
-            initial_offset = len(body)
+        if body_length and content_type == "application/offset+octet-stream":
+            if hasattr(body, "read"):
+                initial_offset = self.storage.write_chunk_stream(upload_id, 0, body, body_length)
+            else:
+                self.storage.write_chunk(upload_id, 0, body)
+                initial_offset = body_length
             self.storage.update_offset(upload_id, initial_offset)
             logger.info(f"creation-with-upload: wrote {initial_offset} bytes for {upload_id}")
 
@@ -301,6 +414,96 @@ class TusServer:
 
         return (201, response_headers, b"")
 
+    def _parse_metadata(self, headers: dict[str, str]) -> dict[str, str]:
+        """Decode the Upload-Metadata header.
+
+        Raises:
+            ValueError: If the header is too large or a value is not valid base64
+        """
+        metadata = {}
+        upload_metadata = headers.get("upload-metadata", "")
+        if upload_metadata:
+            if len(upload_metadata) > self._MAX_METADATA_SIZE:
+                raise ValueError(
+                    f"Upload-Metadata exceeds maximum size of {self._MAX_METADATA_SIZE} bytes"
+                )
+            for pair in upload_metadata.split(","):
+                pair = pair.strip()
+                if " " in pair:
+                    key, value = pair.split(" ", 1)
+                    try:
+                        metadata[key] = base64.b64decode(value).decode("utf-8")
+                    except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+                        raise ValueError(
+                            f"Invalid base64 encoding for metadata key '{key}': {e}"
+                        ) from e
+        return metadata
+
+    def _handle_create_final(
+        self, headers: dict[str, str], upload_concat: str
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Handle POST with Upload-Concat: final;<urls> (concatenation extension).
+
+        Every listed upload must be a completed partial upload; their data is
+        concatenated, in order, into a new upload that is complete on creation.
+        """
+        urls = upload_concat[len("final;") :].split()
+        if not urls:
+            return self._error_response(400, "Invalid Upload-Concat header")
+
+        partial_ids = []
+        for url in urls:
+            path = urlsplit(url).path.rstrip("/")
+            upload_id = path[len(self.base_path) + 1 :]
+            if not path.startswith(self.base_path + "/") or not self._validate_upload_id(upload_id):
+                logger.error(f"Invalid partial upload URL in Upload-Concat: {url}")
+                return self._error_response(400, "Invalid Upload-Concat header")
+            partial_ids.append(upload_id)
+
+        upload_length = 0
+        for upload_id in partial_ids:
+            partial = self.storage.get_upload(upload_id)
+            if not partial:
+                return self._error_response(404, f"Partial upload not found: {upload_id}")
+            if partial.get("upload_concat") != "partial":
+                return self._error_response(400, f"Upload is not a partial upload: {upload_id}")
+            if partial["offset"] != partial["upload_length"]:
+                return self._error_response(400, f"Partial upload is incomplete: {upload_id}")
+            upload_length += partial["upload_length"]
+
+        if self.max_size > 0 and upload_length > self.max_size:
+            logger.warning(f"Upload size {upload_length} exceeds maximum {self.max_size}")
+            return self._error_response(413, "Upload exceeds maximum size")
+
+        try:
+            metadata = self._parse_metadata(headers)
+        except ValueError as e:
+            return self._error_response(400, str(e))
+
+        upload_id = str(uuid.uuid4())
+        expires_at = None
+        if self.upload_expiry:
+            expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.upload_expiry)
+
+        self.storage.create_upload(upload_id, upload_length, metadata, expires_at)
+        self.storage.set_upload_concat(upload_id, upload_concat)
+        self.storage.concatenate_uploads(upload_id, partial_ids)
+        self.storage.update_offset(upload_id, upload_length)
+        logger.info(
+            f"Created final upload {upload_id} from {len(partial_ids)} partial uploads "
+            f"({upload_length} bytes)"
+        )
+
+        response_headers = {
+            "Tus-Resumable": self.TUS_VERSION,
+            "Location": f"{self.base_path}/{upload_id}",
+            "Upload-Offset": str(upload_length),
+        }
+        if expires_at:
+            response_headers["Upload-Expires"] = self._format_expiry(expires_at)
+
+        return (201, response_headers, b"")
+
     def _handle_head(
         self, upload_id: str, headers: dict[str, str]
     ) -> tuple[int, dict[str, str], bytes]:
@@ -330,6 +533,9 @@ class TusServer:
         if expires_at:
             response_headers["Upload-Expires"] = self._format_expiry(expires_at)
 
+        if upload.get("upload_concat"):
+            response_headers["Upload-Concat"] = upload["upload_concat"]
+
         # Include metadata if present
         metadata = upload.get("metadata", {})
         if metadata:
@@ -343,7 +549,7 @@ class TusServer:
         return (200, response_headers, b"")
 
     def _handle_patch(
-        self, upload_id: str, headers: dict[str, str], body: bytes
+        self, upload_id: str, headers: dict[str, str], body: Union[bytes, BinaryIO]
     ) -> tuple[int, dict[str, str], bytes]:
         """Handle PATCH request to append data to upload."""
         upload = self.storage.get_upload(upload_id)
@@ -357,6 +563,11 @@ class TusServer:
             logger.warning(f"Upload expired: {upload_id}")
             return self._error_response(410, "Upload has expired")
 
+        # Final uploads are assembled by the server and never patched
+        if (upload.get("upload_concat") or "").startswith("final;"):
+            logger.warning(f"PATCH on final upload: {upload_id}")
+            return self._error_response(403, "Final upload cannot be modified")
+
         # Check if already completed
         if upload.get("completed"):
             logger.warning(f"Upload already completed: {upload_id}")
@@ -368,6 +579,14 @@ class TusServer:
             logger.error(f"Invalid Content-Type: {content_type}")
             return self._error_response(415, "Invalid Content-Type")
 
+        try:
+            body_length = self._body_length(headers, body)
+        except ValueError:
+            logger.error(f"Invalid Content-Length header: {headers.get('content-length')}")
+            return self._error_response(400, "Invalid Content-Length header")
+        if body_length is None:
+            return self._length_required_response(headers)
+
         # Check upload offset
         upload_offset_str = headers.get("upload-offset")
         if not upload_offset_str:
@@ -390,35 +609,54 @@ class TusServer:
             )
             return self._error_response(409, "Upload-Offset mismatch")
 
-        # Verify checksum if provided
+        # Parse checksum if provided
+        expected_digest = None
         upload_checksum = headers.get("upload-checksum")
         if upload_checksum:
             try:
                 algo, checksum = upload_checksum.split(" ", 1)
                 if algo == "sha1":
-                    computed = hashlib.sha1(body).hexdigest()
-                    provided = base64.b64decode(checksum).hex()
-                    if computed != provided:
-                        logger.error(f"Checksum mismatch for upload {upload_id}")
-                        return self._error_response(460, "Checksum mismatch")
+                    expected_digest = binascii.a2b_base64(checksum)
             except (ValueError, binascii.Error) as e:
                 logger.error(f"Invalid Upload-Checksum header: {e}")
                 return self._error_response(400, "Invalid Upload-Checksum header")
 
+        streaming = hasattr(body, "read")
+        if (
+            expected_digest is not None
+            and not streaming
+            and not hmac.compare_digest(_sha1(body).digest(), expected_digest)
+        ):
+            logger.error(f"Checksum mismatch for upload {upload_id}")
+            return self._error_response(460, "Checksum mismatch")
+
         # Reject chunk if it would exceed the declared upload length
-        new_offset = upload_offset + len(body)
+        new_offset = upload_offset + body_length
         if new_offset > upload["upload_length"]:
             logger.error(f"Chunk exceeds upload length: {new_offset} > {upload['upload_length']}")
             return self._error_response(400, "Chunk would exceed declared upload length")
 
         # Write chunk then atomically advance offset.
         # If another concurrent request already advanced the offset, return 409.
-        self.storage.write_chunk(upload_id, upload_offset, body)
+        if streaming:
+            # Streamed bodies are hashed while copied; on mismatch the offset is
+            # not advanced, so the written bytes are overwritten by the retry
+            hasher = _sha1() if expected_digest is not None else None
+            stream = _HashingReader(body, hasher) if hasher else body
+            body_length = self.storage.write_chunk_stream(
+                upload_id, upload_offset, stream, body_length
+            )
+            if hasher and not hmac.compare_digest(hasher.digest(), expected_digest):
+                logger.error(f"Checksum mismatch for upload {upload_id}")
+                return self._error_response(460, "Checksum mismatch")
+            new_offset = upload_offset + body_length
+        else:
+            self.storage.write_chunk(upload_id, upload_offset, body)
         if not self.storage.update_offset_atomic(upload_id, upload_offset, new_offset):
             return self._error_response(409, "Concurrent write conflict; use HEAD to re-sync")
 
         logger.info(
-            f"PATCH upload {upload_id}: wrote {len(body)} bytes, "
+            f"PATCH upload {upload_id}: wrote {body_length} bytes, "
             f"new offset: {new_offset}/{upload['upload_length']}"
         )
 
@@ -485,8 +723,9 @@ class TusHTTPRequestHandler(BaseHTTPRequestHandler):
 
     def _handle_request(self, method: str) -> None:
         """Handle incoming request."""
-        # Read body for POST/PATCH
-        body = b""
+        # POST/PATCH bodies are streamed from the socket into storage
+        body: Union[bytes, BinaryIO] = b""
+        reader: Optional[_LimitedReader] = None
         if method in ("POST", "PATCH"):
             try:
                 content_length = int(self.headers.get("Content-Length", 0))
@@ -510,7 +749,11 @@ class TusHTTPRequestHandler(BaseHTTPRequestHandler):
                 self.wfile.write(b"Request entity too large")
                 return
             if content_length > 0:
-                body = self.rfile.read(content_length)
+                reader = _LimitedReader(self.rfile, content_length)
+                body = reader
+            elif "Transfer-Encoding" in self.headers:
+                # Passed as a stream without Content-Length, which TusServer rejects
+                body = self.rfile
 
         # Convert headers to dict
         headers = dict(self.headers)
@@ -520,10 +763,24 @@ class TusHTTPRequestHandler(BaseHTTPRequestHandler):
             method, self.path, headers, body
         )
 
+        # An error response leaves the body unread; it must be consumed first, or
+        # closing the connection resets it before the client reads the response
+        close = False
+        if reader is not None and reader.remaining:
+            max_size = self.tus_server.max_size
+            drain_limit = max_size if max_size > 0 else _MAX_DRAIN_SIZE
+            close = reader.remaining > drain_limit or not reader.drain()
+        elif body is self.rfile:
+            # A body of unknown length is never read, so the connection can't be reused
+            close = True
+
         # Send response
         self.send_response(status)
         for key, value in response_headers.items():
             self.send_header(key, value)
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
         self.end_headers()
         if response_body:
             self.wfile.write(response_body)
@@ -6,8 +6,10 @@ import os
 import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 try:
     import fcntl as _fcntl
@@ -16,10 +18,45 @@ try:
 except ImportError:
     _HAS_FCNTL = False
 
+# Block size used when copying a request body stream to disk
+_STREAM_BLOCK_SIZE = 1024 * 1024
+
+_HAS_PWRITE = hasattr(os, "pwrite")
+_HAS_FALLOCATE = hasattr(os, "posix_fallocate")
+
+# Idle SQLite connections kept open by SQLiteStorage for reuse
+_MAX_IDLE_CONNECTIONS = 8
+
+# Upload files SQLiteStorage keeps open between chunks
+_MAX_OPEN_FILES = 256
+
+
+def _write_at(f: Any, data: Any, offset: int) -> None:
+    """Write all of data at offset in the unbuffered file f.
+
+    Uses os.pwrite (one syscall, no seek) where available and falls back to
+    seek + write elsewhere; both loop on short writes.
+    """
+    view = memoryview(data)
+    if not _HAS_PWRITE:
+        f.seek(offset)
+        while view:
+            view = view[f.write(view) :]
+        return
+    fd = f.fileno()
+    while view:
+        n = os.pwrite(fd, view, offset)
+        view = view[n:]
+        offset += n
+
 
 class Storage(ABC):
     """Abstract base class for storage backends."""
 
+    # Whether set_upload_concat is implemented; TusServer only advertises and
+    # accepts the concatenation extension when this is True
+    supports_concatenation = False
+
     @abstractmethod
     def create_upload(
         self,
@@ -64,6 +101,45 @@ class Storage(ABC):
         """Write a chunk of data to the upload file."""
         pass
 
+    def write_chunk_stream(self, upload_id: str, offset: int, stream: BinaryIO, length: int) -> int:
+        """Copy up to length bytes from a binary stream into the upload file.
+
+        Returns the number of bytes written, which is less than length if the
+        stream ends early. Default implementation calls write_chunk once per
+        block, so memory use stays bounded; SQLiteStorage overrides it to keep
+        the file open and locked for the whole copy.
+        """
+        written = 0
+        while written < length:
+            block = stream.read(min(_STREAM_BLOCK_SIZE, length - written))
+            if not block:
+                break
+            self.write_chunk(upload_id, offset + written, block)
+            written += len(block)
+        return written
+
+    def set_upload_concat(self, upload_id: str, upload_concat: str) -> None:  # noqa: B027
+        """Record the Upload-Concat value ("partial" or "final;<urls>") of an upload.
+
+        Optional: TusServer only calls this when supports_concatenation is
+        True, so the default does nothing. Backends that set the attribute
+        override it and return the value as "upload_concat" from get_upload.
+        """
+
+    def concatenate_uploads(self, upload_id: str, partial_ids: list[str]) -> int:
+        """Write the data of partial_ids, in order, into the upload file of upload_id.
+
+        Returns the number of bytes written. Default implementation streams
+        each partial file through write_chunk_stream.
+        """
+        offset = 0
+        for partial_id in partial_ids:
+            partial = self.get_upload(partial_id)
+            length = partial["upload_length"] if partial else 0
+            with open(self.get_file_path(partial_id), "rb") as f:
+                offset += self.write_chunk_stream(upload_id, offset, f, length)
+        return offset
+
     @abstractmethod
     def read_file(self, upload_id: str) -> bytes:
         """Read the complete uploaded file."""
@@ -86,22 +162,96 @@ class Storage(ABC):
 
 
 class SQLiteStorage(Storage):
-    """SQLite-based storage backend."""
+    """SQLite-based storage backend.
 
-    def __init__(self, db_path: str = "uploads.db", upload_dir: str = "uploads"):
+    Connections are opened once and reused across requests (up to 8 idle),
+    in autocommit mode on a WAL-journaled database with synchronous=NORMAL:
+    a PATCH costs one small WAL append instead of a connect plus a rollback
+    journal fsync. Call close() to release them.
+    """
+
+    supports_concatenation = True
+
+    def __init__(
+        self,
+        db_path: str = "uploads.db",
+        upload_dir: str = "uploads",
+        cache_size: int = 0,
+        preallocate: bool = False,
+    ):
         """Initialize SQLite storage.
 
         Args:
             db_path: Path to SQLite database file
             upload_dir: Directory to store uploaded files
+            cache_size: Number of upload records kept in memory, least recently
+                used evicted first (default: 0, disabled). get_upload() on a
+                cached upload (every PATCH and HEAD) then skips SQLite. Only
+                for a single server process: other processes' writes to the
+                database are not seen.
+            preallocate: Reserve the full Upload-Length on disk when an upload
+                is created (os.posix_fallocate, where available), so chunk
+                writes fill allocated blocks instead of extending the file and
+                a full disk is reported at creation (default: False). The
+                space stays reserved until the upload is deleted or expires.
         """
         self.db_path = db_path
         self.upload_dir = upload_dir
+        self.cache_size = cache_size
+        self.preallocate = preallocate
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by every write; a row read before a write is not cached
+        self._cache_generation = 0
         os.makedirs(upload_dir, exist_ok=True)
         self._file_locks: dict[str, threading.Lock] = {}
         self._file_locks_lock = threading.Lock()
+        # upload_id -> upload file left open after its last write, least recent first
+        self._open_files: OrderedDict[str, BinaryIO] = OrderedDict()
+        self._open_files_lock = threading.Lock()
+        self._idle_connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new autocommit connection to the database."""
+        # Handed between request threads by _connection(), never used by two at once
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Durable across process crashes in WAL mode; only an OS crash can lose
+        # the last commits
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow an idle connection (or open one) for the duration of the block."""
+        with self._connections_lock:
+            conn = self._idle_connections.pop() if self._idle_connections else None
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            with self._connections_lock:
+                keep = len(self._idle_connections) < _MAX_IDLE_CONNECTIONS
+                if keep:
+                    self._idle_connections.append(conn)
+            if not keep:
+                conn.close()
+
+    def close(self) -> None:
+        """Close the idle database connections and open upload files."""
+        with self._connections_lock:
+            idle, self._idle_connections = self._idle_connections, []
+        for conn in idle:
+            conn.close()
+        with self._open_files_lock:
+            files, self._open_files = self._open_files, OrderedDict()
+        for f in files.values():
+            f.close()
+
     def _get_file_lock(self, upload_id: str) -> threading.Lock:
         """Get or create a per-upload threading lock."""
         with self._file_locks_lock:
@@ -109,10 +259,51 @@ class SQLiteStorage(Storage):
                 self._file_locks[upload_id] = threading.Lock()
             return self._file_locks[upload_id]
 
+    @contextlib.contextmanager
+    def _locked_file(self, upload_id: str) -> Iterator[BinaryIO]:
+        """Hold the upload's locks and yield its file, open unbuffered for writing.
+
+        The file stays open after the block for the next chunk (up to 256
+        files, least recently used closed first), so a chunk costs no path
+        lookup or open. A missing file is created.
+        """
+        with self._get_file_lock(upload_id):
+            # Taken out of the cache while in use, so eviction never closes it
+            with self._open_files_lock:
+                f = self._open_files.pop(upload_id, None)
+            if f is None:
+                flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                fd = os.open(self.get_file_path(upload_id), flags, 0o666)
+                f = open(fd, "r+b", buffering=0)  # noqa: SIM115
+            try:
+                if _HAS_FCNTL:
+                    _fcntl.flock(f, _fcntl.LOCK_EX)
+                try:
+                    yield f
+                finally:
+                    if _HAS_FCNTL:
+                        _fcntl.flock(f, _fcntl.LOCK_UN)
+            finally:
+                with self._open_files_lock:
+                    self._open_files[upload_id] = f
+                    evicted = []
+                    while len(self._open_files) > _MAX_OPEN_FILES:
+                        evicted.append(self._open_files.popitem(last=False)[1])
+                for old in evicted:
+                    old.close()
+
+    def _close_file(self, upload_id: str) -> None:
+        """Close the upload's cached file once no write is using it."""
+        with self._get_file_lock(upload_id), self._open_files_lock:
+            f = self._open_files.pop(upload_id, None)
+        if f is not None:
+            f.close()
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
+            # Persistent: recorded in the database file for every later connection
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS uploads (
@@ -128,9 +319,9 @@ class SQLiteStorage(Storage):
             # Migration: add expires_at column for existing databases
             with contextlib.suppress(sqlite3.OperationalError):
                 conn.execute("ALTER TABLE uploads ADD COLUMN expires_at TIMESTAMP")
-            conn.commit()
-        finally:
-            conn.close()
+            # Migration: add upload_concat column (concatenation extension)
+            with contextlib.suppress(sqlite3.OperationalError):
+                conn.execute("ALTER TABLE uploads ADD COLUMN upload_concat TEXT")
 
     def create_upload(
         self,
@@ -140,8 +331,7 @@ class SQLiteStorage(Storage):
         expires_at: Optional[datetime] = None,
     ) -> None:
         """Create a new upload entry."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
             expires_at_str = expires_at.astimezone(timezone.utc).isoformat() if expires_at else None
             conn.execute(
                 """
@@ -150,28 +340,47 @@ class SQLiteStorage(Storage):
                 """,
                 (upload_id, upload_length, json.dumps(metadata), expires_at_str),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
         # Create empty file; roll back DB record if file creation fails
         file_path = self.get_file_path(upload_id)
         try:
-            with open(file_path, "wb"):
-                pass
+            with open(file_path, "wb") as f:
+                if self.preallocate and upload_length and _HAS_FALLOCATE:
+                    os.posix_fallocate(f.fileno(), 0, upload_length)
         except OSError:
             self.delete_upload(upload_id)
             raise
 
+    def _cache_update(self, upload_id: str, **fields: Any) -> None:
+        """Apply fields to the cached record of upload_id, if cached."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            record = self._cache.get(upload_id)
+            if record is not None:
+                record.update(fields)
+                if "offset" in fields:
+                    record["completed"] = record["offset"] >= record["upload_length"]
+
+    def _cache_evict(self, upload_id: str) -> None:
+        """Drop the cached record of upload_id."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.pop(upload_id, None)
+
     def get_upload(self, upload_id: str) -> Optional[dict[str, Any]]:
         """Get upload information."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.row_factory = sqlite3.Row
+        if self.cache_size:
+            with self._cache_lock:
+                record = self._cache.get(upload_id)
+                if record is not None:
+                    self._cache.move_to_end(upload_id)
+                    # Copies, so callers mutating the record can't change the cache
+                    return dict(record, metadata=dict(record["metadata"]))
+                generation = self._cache_generation
+
+        with self._connection() as conn:
             cursor = conn.execute("SELECT * FROM uploads WHERE upload_id = ?", (upload_id,))
             row = cursor.fetchone()
-        finally:
-            conn.close()
 
         if row is None:
             return None
@@ -187,52 +396,65 @@ class SQLiteStorage(Storage):
             except (ValueError, AttributeError):
                 pass
 
-        return {
+        record = {
             "upload_id": row["upload_id"],
             "upload_length": row["upload_length"],
             "offset": row["offset"],
             "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
             "completed": bool(row["completed"]),
             "expires_at": expires_at,
+            "upload_concat": row["upload_concat"],
         }
+        if self.cache_size:
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._cache[upload_id] = dict(record, metadata=dict(record["metadata"]))
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return record
 
     def update_offset(self, upload_id: str, offset: int) -> None:
         """Update the current offset of an upload."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
             conn.execute(
                 "UPDATE uploads SET offset = ?, completed = (? >= upload_length)"
                 " WHERE upload_id = ?",
                 (offset, offset, upload_id),
             )
-            conn.commit()
-        finally:
-            conn.close()
+        self._cache_update(upload_id, offset=offset)
 
     def update_offset_atomic(self, upload_id: str, expected_offset: int, new_offset: int) -> bool:
         """Atomically update offset; returns False on concurrent conflict."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
                 "UPDATE uploads SET offset = ?, completed = (? >= upload_length)"
                 " WHERE upload_id = ? AND offset = ?",
                 (new_offset, new_offset, upload_id, expected_offset),
             )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        if cursor.rowcount > 0:
+            self._cache_update(upload_id, offset=new_offset)
+            return True
+        # The cached offset is stale (e.g. written by another process): re-read it next time
+        self._cache_evict(upload_id)
+        return False
+
+    def set_upload_concat(self, upload_id: str, upload_concat: str) -> None:
+        """Record the Upload-Concat value of an upload."""
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE uploads SET upload_concat = ? WHERE upload_id = ?",
+                (upload_concat, upload_id),
+            )
+        self._cache_update(upload_id, upload_concat=upload_concat)
 
     def delete_upload(self, upload_id: str) -> None:
         """Delete an upload entry."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
             conn.execute("DELETE FROM uploads WHERE upload_id = ?", (upload_id,))
-            conn.commit()
-        finally:
-            conn.close()
+        self._cache_evict(upload_id)
 
-        # Delete file if exists
+        # Delete file if exists (closed first: Windows cannot remove open files)
+        self._close_file(upload_id)
         file_path = self.get_file_path(upload_id)
         if os.path.exists(file_path):
             os.remove(file_path)
@@ -246,17 +468,38 @@ class SQLiteStorage(Storage):
 
         Thread-safe and multi-process-safe: uses a per-upload threading.Lock
         (in-process) combined with fcntl.flock (cross-process, POSIX only).
+        The file is kept open for the upload's next chunk.
         """
-        file_path = self.get_file_path(upload_id)
-        if not os.path.exists(file_path):
-            with open(file_path, "wb"):
-                pass
-        lock = self._get_file_lock(upload_id)
-        with lock, open(file_path, "r+b") as f:
-            if _HAS_FCNTL:
-                _fcntl.flock(f, _fcntl.LOCK_EX)
-            f.seek(offset)
-            f.write(data)
+        with self._locked_file(upload_id) as f:
+            _write_at(f, data, offset)
+
+    def write_chunk_stream(self, upload_id: str, offset: int, stream: BinaryIO, length: int) -> int:
+        """Copy up to length bytes from a binary stream into the upload file.
+
+        Same locking as write_chunk; the body is copied in 1 MiB blocks so
+        memory use does not grow with the request size. Streams that support
+        readinto() are read into one reusable buffer instead of a new bytes
+        object per block.
+        """
+        written = 0
+        readinto = getattr(stream, "readinto", None)
+        with self._locked_file(upload_id) as f:
+            if readinto is not None:
+                buf = memoryview(bytearray(min(_STREAM_BLOCK_SIZE, length)))
+                while written < length:
+                    n = readinto(buf[: min(len(buf), length - written)])
+                    if not n:
+                        break
+                    _write_at(f, buf[:n], offset + written)
+                    written += n
+            else:
+                while written < length:
+                    block = stream.read(min(_STREAM_BLOCK_SIZE, length - written))
+                    if not block:
+                        break
+                    _write_at(f, block, offset + written)
+                    written += len(block)
+        return written
 
     def read_file(self, upload_id: str) -> bytes:
         """Read the complete uploaded file."""
@@ -270,16 +513,13 @@ class SQLiteStorage(Storage):
 
     def get_expired_uploads(self) -> list[str]:
         """Get list of expired upload IDs."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._connection() as conn:
             now = datetime.now(timezone.utc).isoformat()
             cursor = conn.execute(
                 "SELECT upload_id FROM uploads WHERE expires_at IS NOT NULL AND expires_at < ?",
                 (now,),
             )
             rows = cursor.fetchall()
-        finally:
-            conn.close()
         return [row[0] for row in rows]
 
     def cleanup_expired_uploads(self) -> int:
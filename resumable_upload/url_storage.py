@@ -20,6 +20,9 @@ try:
 except ImportError:
     _HAS_FCNTL = False
 
+# Journal entries FileURLStorage appends before folding them into the JSON file
+_COMPACT_EVERY = 1000
+
 
 class URLStorage(ABC):
     """Abstract interface for URL storage implementations."""
@@ -58,12 +61,33 @@ class URLStorage(ABC):
         """
         pass
 
+    def update_urls(self, changes: dict[str, Optional[str]]) -> None:
+        """
+        Apply several URL changes at once.
+
+        The default calls set_url/remove_url per entry; backends that can
+        persist a batch in one write should override this.
+
+        Args:
+            changes: Mapping of fingerprint to URL, or to None to remove it
+        """
+        for fingerprint, url in changes.items():
+            if url is None:
+                self.remove_url(fingerprint)
+            else:
+                self.set_url(fingerprint, url)
+
 
 class FileURLStorage(URLStorage):
     """
     File-based URL storage using JSON.
 
     Stores upload URLs in a JSON file for persistence across sessions.
+    Changes are appended to a journal next to it (storage_path + ".log", one
+    JSON line per change) instead of rewriting the whole file, and the URLs
+    are kept in memory: a lookup only reads journal lines written since the
+    last one. Every 1000 journal entries, and on compact(), the journal is
+    folded back into the JSON file.
     Thread-safe (threading.Lock) and multi-process-safe (fcntl.flock on POSIX).
     """
 
@@ -75,8 +99,15 @@ class FileURLStorage(URLStorage):
             storage_path: Path to JSON file for storing URLs
         """
         self.storage_path = storage_path
+        self._log_path = storage_path + ".log"
         self._lock_file_path = storage_path + ".lock"
         self._lock = threading.Lock()
+        # In-memory copy: the JSON file identified by _snapshot_id, plus the
+        # first _log_pos bytes (_log_entries entries) of the journal
+        self._data: dict[str, str] = {}
+        self._snapshot_id: Optional[tuple[int, int, int]] = None
+        self._log_pos = 0
+        self._log_entries = 0
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
@@ -106,6 +137,68 @@ class FileURLStorage(URLStorage):
                 os.unlink(tmp_path)
             raise
 
+    def _snapshot_stat(self) -> Optional[tuple[int, int, int]]:
+        """Return (inode, mtime, size) of the JSON file, which compaction replaces."""
+        try:
+            st = os.stat(self.storage_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _refresh(self) -> None:
+        """Catch the in-memory copy up with the files (file lock held)."""
+        snapshot_id = self._snapshot_stat()
+        if snapshot_id != self._snapshot_id:
+            # First load, or another instance compacted: the journal was emptied too
+            self._data = self._load_data()
+            self._snapshot_id = snapshot_id
+            self._log_pos = self._log_entries = 0
+        try:
+            with open(self._log_path, "rb") as f:
+                f.seek(self._log_pos)
+                new = f.read()
+        except FileNotFoundError:
+            return
+        # A trailing partial line is left for the next refresh
+        end = new.rfind(b"\n") + 1
+        for line in new[:end].splitlines():
+            try:
+                fingerprint, url = json.loads(line)
+            except (ValueError, TypeError):
+                continue
+            self._apply(fingerprint, url)
+            self._log_entries += 1
+        self._log_pos += end
+
+    def _apply(self, fingerprint: str, url: Optional[str]) -> None:
+        if url is None:
+            self._data.pop(fingerprint, None)
+        else:
+            self._data[fingerprint] = url
+
+    def _append(self, changes: dict[str, Optional[str]]) -> None:
+        """Journal changes and apply them in memory (exclusive file lock held)."""
+        self._refresh()
+        lines = "".join(json.dumps([fp, url]) + "\n" for fp, url in changes.items())
+        record = lines.encode("utf-8")
+        with open(self._log_path, "ab") as f:
+            f.write(record)
+        for fingerprint, url in changes.items():
+            self._apply(fingerprint, url)
+        self._log_pos += len(record)
+        self._log_entries += len(changes)
+        if self._log_entries >= _COMPACT_EVERY:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the JSON file from memory and empty the journal (exclusive lock held)."""
+        self._save_data(self._data)
+        # Crashing before the truncate is harmless: replaying the journal is idempotent
+        with open(self._log_path, "wb"):
+            pass
+        self._snapshot_id = self._snapshot_stat()
+        self._log_pos = self._log_entries = 0
+
     @contextlib.contextmanager
     def _file_lock(self, exclusive: bool = True):
         """Acquire an exclusive or shared fcntl file lock (POSIX only)."""
@@ -123,20 +216,96 @@ class FileURLStorage(URLStorage):
     def get_url(self, fingerprint: str) -> Optional[str]:
         """Retrieve upload URL for fingerprint."""
         with self._lock, self._file_lock(exclusive=False):
-            data = self._load_data()
-        return data.get(fingerprint)
+            self._refresh()
+            return self._data.get(fingerprint)
 
     def set_url(self, fingerprint: str, url: str) -> None:
         """Store upload URL for fingerprint."""
-        with self._lock, self._file_lock(exclusive=True):
-            data = self._load_data()
-            data[fingerprint] = url
-            self._save_data(data)
+        self.update_urls({fingerprint: url})
 
     def remove_url(self, fingerprint: str) -> None:
         """Remove URL for fingerprint."""
+        self.update_urls({fingerprint: None})
+
+    def update_urls(self, changes: dict[str, Optional[str]]) -> None:
+        """Apply several URL changes with a single journal append."""
+        if not changes:
+            return
+        with self._lock, self._file_lock(exclusive=True):
+            self._append(changes)
+
+    def compact(self) -> None:
+        """Fold the journal into the JSON file now."""
         with self._lock, self._file_lock(exclusive=True):
-            data = self._load_data()
-            if fingerprint in data:
-                del data[fingerprint]
-                self._save_data(data)
+            self._refresh()
+            self._compact()
+
+
+class BufferedURLStorage(URLStorage):
+    """
+    Write-behind wrapper that batches changes to another URL storage.
+
+    set_url/remove_url are kept in memory and handed to the wrapped storage's
+    update_urls() every flush_every changes, on flush() and on close(). With
+    FileURLStorage this turns one journal append per upload into one per batch.
+    Unflushed URLs are lost if the process dies, so those uploads start over
+    instead of resuming.
+
+    Thread-safe (threading.Lock).
+    """
+
+    def __init__(self, storage: URLStorage, flush_every: int = 16):
+        """
+        Initialize buffered URL storage.
+
+        Args:
+            storage: URL storage that receives the batched changes
+            flush_every: Number of pending changes that triggers a flush (default: 16)
+        """
+        self.storage = storage
+        self.flush_every = flush_every
+        self._pending: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - flush pending changes."""
+        self.close()
+
+    def get_url(self, fingerprint: str) -> Optional[str]:
+        """Retrieve upload URL for fingerprint, including unflushed changes."""
+        with self._lock:
+            if fingerprint in self._pending:
+                return self._pending[fingerprint]
+        return self.storage.get_url(fingerprint)
+
+    def set_url(self, fingerprint: str, url: str) -> None:
+        """Buffer URL for fingerprint."""
+        self._buffer(fingerprint, url)
+
+    def remove_url(self, fingerprint: str) -> None:
+        """Buffer removal of the URL for fingerprint."""
+        self._buffer(fingerprint, None)
+
+    def _buffer(self, fingerprint: str, url: Optional[str]) -> None:
+        """Record a pending change, flushing once flush_every changes are pending."""
+        with self._lock:
+            self._pending[fingerprint] = url
+            if len(self._pending) < self.flush_every:
+                return
+            pending, self._pending = self._pending, {}
+        self.storage.update_urls(pending)
+
+    def flush(self) -> None:
+        """Write all pending changes to the wrapped storage."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            self.storage.update_urls(pending)
+
+    def close(self) -> None:
+        """Flush pending changes."""
+        self.flush()
@@ -40,9 +40,8 @@ def tus_view(temp_dir):
             headers["Content-Type"] = request.META["CONTENT_TYPE"]
         if request.META.get("CONTENT_LENGTH"):
             headers["Content-Length"] = request.META["CONTENT_LENGTH"]
-        body = request.body
         status, response_headers, response_body = tus_server.handle_request(
-            request.method, path, headers, body
+            request.method, path, headers, request
         )
         response = HttpResponse(response_body, status=status)
         for key, value in response_headers.items():
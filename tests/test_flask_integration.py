@@ -38,7 +38,7 @@ def flask_app(temp_dir):
         from flask import make_response, request
 
         status, headers, body = tus_server.handle_request(
-            request.method, request.path, dict(request.headers), request.get_data()
+            request.method, request.path, dict(request.headers), request.stream
         )
         response = make_response(body, status)
         for key, value in headers.items():
@@ -601,3 +601,186 @@ class TestTusServer:
         )
         assert status == 204
         assert resp_headers["Upload-Offset"] == str(len(data))
+
+    def test_patch_with_stream_body(self, server, storage):
+        """PATCH accepts a file-like body and streams Content-Length bytes to storage."""
+        import io
+
+        upload_id = str(uuid.uuid4())
+        storage.create_upload(upload_id, 100, {})
+
+        headers = {
+            "tus-resumable": "1.0.0",
+            "upload-offset": "0",
+            "content-type": "application/offset+octet-stream",
+            "content-length": "5",
+        }
+        status, resp_headers, _ = server.handle_request(
+            "PATCH", f"/files/{upload_id}", headers, io.BytesIO(b"helloEXTRA")
+        )
+        assert status == 204
+        assert resp_headers["Upload-Offset"] == "5"
+        assert storage.read_file(upload_id) == b"hello"
+
+    def test_stream_body_without_content_length_is_rejected(self, server, storage):
+        """A streamed body of unknown length gets 411 (400 with Transfer-Encoding)."""
+        import io
+
+        upload_id = str(uuid.uuid4())
+        storage.create_upload(upload_id, 100, {})
+        headers = {
+            "tus-resumable": "1.0.0",
+            "upload-offset": "0",
+            "content-type": "application/offset+octet-stream",
+        }
+        status, _, _ = server.handle_request(
+            "PATCH", f"/files/{upload_id}", headers, io.BytesIO(b"hello")
+        )
+        assert status == 411
+        status, _, _ = server.handle_request(
+            "PATCH",
+            f"/files/{upload_id}",
+            {**headers, "transfer-encoding": "chunked"},
+            io.BytesIO(b"hello"),
+        )
+        assert status == 400
+        assert storage.get_upload(upload_id)["offset"] == 0
+
+        headers = {"tus-resumable": "1.0.0", "upload-length": "100"}
+        status, _, _ = server.handle_request(
+            "POST",
+            "/files",
+            {**headers, "content-type": "application/offset+octet-stream"},
+            io.BytesIO(b"hello"),
+        )
+        assert status == 411
+        # Creation without initial data doesn't need a length
+        status, _, _ = server.handle_request("POST", "/files", headers, io.BytesIO(b""))
+        assert status == 201
+
+    def test_stream_body_checksum_mismatch_does_not_advance_offset(self, server, storage):
+        """A streamed PATCH with a wrong checksum returns 460 and keeps the offset."""
+        import base64
+        import hashlib
+        import io
+
+        upload_id = str(uuid.uuid4())
+        storage.create_upload(upload_id, 100, {})
+
+        wrong_checksum = base64.b64encode(hashlib.sha1(b"wrong data").digest()).decode()
+        headers = {
+            "tus-resumable": "1.0.0",
+            "upload-offset": "0",
+            "content-type": "application/offset+octet-stream",
+            "content-length": "5",
+            "upload-checksum": f"sha1 {wrong_checksum}",
+        }
+        status, _, _ = server.handle_request(
+            "PATCH", f"/files/{upload_id}", headers, io.BytesIO(b"hello")
+        )
+        assert status == 460
+        assert storage.get_upload(upload_id)["offset"] == 0
+
+    def test_creation_with_upload_stream_body(self, server, storage):
+        """POST with a streamed body writes the initial data (creation-with-upload)."""
+        import io
+
+        headers = {
+            "tus-resumable": "1.0.0",
+            "upload-length": "10",
+            "content-type": "application/offset+octet-stream",
+            "content-length": "4",
+        }
+        status, resp_headers, _ = server.handle_request(
+            "POST", "/files", headers, io.BytesIO(b"data")
+        )
+        assert status == 201
+        assert resp_headers["Upload-Offset"] == "4"
+        upload_id = resp_headers["Location"].rsplit("/", 1)[-1]
+        assert storage.read_file(upload_id) == b"data"
+
+    # --- Concatenation extension ---
+
+    def _create_partial(self, server, data):
+        headers = {
+            "tus-resumable": "1.0.0",
+            "upload-length": str(len(data)),
+            "upload-concat": "partial",
+            "content-type": "application/offset+octet-stream",
+        }
+        status, resp_headers, _ = server.handle_request("POST", "/files", headers, data)
+        assert status == 201
+        return resp_headers["Location"]
+
+    def test_concatenation_in_supported_extensions(self, server):
+        """concatenation is listed in Tus-Extension for SQLiteStorage."""
+        _, headers, _ = server.handle_request("OPTIONS", "/files", {})
+        assert "concatenation" in headers["Tus-Extension"]
+
+    def test_concatenation_requires_storage_support(self, storage):
+        """A backend without supports_concatenation gets no concatenation extension."""
+        storage.supports_concatenation = False
+        server = TusServer(storage=storage, base_path="/files")
+        _, headers, _ = server.handle_request("OPTIONS", "/files", {})
+        assert "concatenation" not in headers["Tus-Extension"]
+
+        headers = {"tus-resumable": "1.0.0", "upload-concat": "final;/files/x"}
+        status, _, _ = server.handle_request("POST", "/files", headers)
+        assert status == 400
+
+    def test_concatenate_partial_uploads(self, server, storage):
+        """A final upload concatenates completed partial uploads in order."""
+        first = self._create_partial(server, b"Hello ")
+        second = self._create_partial(server, b"World!")
+
+        status, headers, _ = server.handle_request("HEAD", first, {"tus-resumable": "1.0.0"})
+        assert headers["Upload-Concat"] == "partial"
+
+        concat = f"final;{first} http://localhost{second}"
+        status, resp_headers, _ = server.handle_request(
+            "POST", "/files", {"tus-resumable": "1.0.0", "upload-concat": concat}
+        )
+        assert status == 201
+        final_id = resp_headers["Location"].rsplit("/", 1)[-1]
+        assert storage.read_file(final_id) == b"Hello World!"
+
+        status, headers, _ = server.handle_request(
+            "HEAD", resp_headers["Location"], {"tus-resumable": "1.0.0"}
+        )
+        assert headers["Upload-Offset"] == headers["Upload-Length"] == "12"
+        assert headers["Upload-Concat"] == concat
+
+        status, _, _ = server.handle_request(
+            "PATCH",
+            resp_headers["Location"],
+            {
+                "tus-resumable": "1.0.0",
+                "upload-offset": "12",
+                "content-type": "application/offset+octet-stream",
+            },
+            b"x",
+        )
+        assert status == 403
+
+    def test_concatenate_rejects_incomplete_or_non_partial_uploads(self, server, storage):
+        """Final creation fails unless every listed upload is a completed partial."""
+        headers = {"tus-resumable": "1.0.0", "upload-length": "10", "upload-concat": "partial"}
+        _, resp_headers, _ = server.handle_request("POST", "/files", headers)
+        incomplete = resp_headers["Location"]
+        _, resp_headers, _ = server.handle_request(
+            "POST", "/files", {"tus-resumable": "1.0.0", "upload-length": "0"}
+        )
+        regular = resp_headers["Location"]
+
+        for url in (incomplete, regular):
+            status, _, _ = server.handle_request(
+                "POST", "/files", {"tus-resumable": "1.0.0", "upload-concat": f"final;{url}"}
+            )
+            assert status == 400
+
+        status, _, _ = server.handle_request(
+            "POST",
+            "/files",
+            {"tus-resumable": "1.0.0", "upload-concat": f"final;/files/{_NONEXISTENT_UUID}"},
+        )
+        assert status == 404
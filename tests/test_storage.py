@@ -1,5 +1,7 @@
 """Test suite for storage module."""
 
+import contextlib
+import io
 import os
 import shutil
 import sqlite3
@@ -27,7 +29,103 @@ class TestSQLiteStorage:
         """Create a storage instance for tests."""
         db_path = os.path.join(temp_dir, "test.db")
         upload_dir = os.path.join(temp_dir, "uploads")
-        return SQLiteStorage(db_path=db_path, upload_dir=upload_dir)
+        storage = SQLiteStorage(db_path=db_path, upload_dir=upload_dir)
+        yield storage
+        storage.close()
+
+    def test_connections_are_reused_in_wal_mode(self, storage):
+        """Requests borrow a persistent connection on a WAL-journaled database."""
+        with storage._connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        storage.create_upload("reused", 10, {})
+        storage.update_offset("reused", 5)
+        assert storage.get_upload("reused")["offset"] == 5
+        assert storage._idle_connections == [conn]
+
+        storage.close()
+        assert storage._idle_connections == []
+
+    def test_cached_upload_records_follow_writes(self, temp_dir):
+        """With cache_size, records are served from memory and kept up to date."""
+        storage = SQLiteStorage(
+            db_path=os.path.join(temp_dir, "cache.db"),
+            upload_dir=os.path.join(temp_dir, "uploads"),
+            cache_size=1,
+        )
+        storage.create_upload("a", 10, {"name": "a"})
+        storage.create_upload("b", 10, {})
+        assert storage.get_upload("a")["offset"] == 0
+
+        assert storage.update_offset_atomic("a", 0, 10)
+        with storage._connection() as conn:
+            # Out-of-band change: a cached record is not re-read
+            conn.execute("UPDATE uploads SET metadata = '{}' WHERE upload_id = 'a'")
+        upload = storage.get_upload("a")
+        assert (upload["offset"], upload["completed"], upload["metadata"]) == (
+            10,
+            True,
+            {"name": "a"},
+        )
+
+        # Least recently used record is evicted
+        storage.get_upload("b")
+        assert list(storage._cache) == ["b"]
+        storage.delete_upload("b")
+        assert storage.get_upload("b") is None
+        storage.close()
+
+    def test_cached_upload_records_never_go_stale(self, temp_dir):
+        """A failed compare-and-swap evicts the record; a row read before a write isn't cached."""
+        db_path = os.path.join(temp_dir, "cache.db")
+        upload_dir = os.path.join(temp_dir, "uploads")
+        storage = SQLiteStorage(db_path=db_path, upload_dir=upload_dir, cache_size=8)
+        other = SQLiteStorage(db_path=db_path, upload_dir=upload_dir)
+        storage.create_upload("a", 100, {})
+        assert storage.get_upload("a")["offset"] == 0
+
+        # Another process advances the offset; the stale cached record is dropped on conflict
+        assert other.update_offset_atomic("a", 0, 50)
+        assert not storage.update_offset_atomic("a", 0, 10)
+        assert storage.get_upload("a")["offset"] == 50
+
+        # A write that commits between get_upload's SELECT and its cache fill
+        storage._cache.clear()
+        connection = storage._connection
+        writes = []
+
+        @contextlib.contextmanager
+        def racing_connection():
+            with connection() as conn:
+                yield conn
+            if not writes:
+                writes.append(True)
+                storage.update_offset("a", 60)
+
+        storage._connection = racing_connection
+        assert storage.get_upload("a")["offset"] == 50
+        storage._connection = connection
+        assert storage.get_upload("a")["offset"] == 60
+        storage.close()
+        other.close()
+
+    def test_cached_upload_records_are_copies(self, temp_dir):
+        """Mutating a record returned by get_upload doesn't change the cached one."""
+        storage = SQLiteStorage(
+            db_path=os.path.join(temp_dir, "cache.db"),
+            upload_dir=os.path.join(temp_dir, "uploads"),
+            cache_size=1,
+        )
+        storage.create_upload("a", 10, {"name": "a"})
+        for _ in range(2):
+            # First read fills the cache, the second is served from it
+            upload = storage.get_upload("a")
+            upload["offset"] = 5
+            upload["metadata"]["name"] = "changed"
+
+        upload = storage.get_upload("a")
+        assert (upload["offset"], upload["metadata"]) == (0, {"name": "a"})
+        storage.close()
 
     def test_create_upload(self, storage):
         """Test creating an upload."""
@@ -78,6 +176,56 @@ class TestSQLiteStorage:
         data = storage.read_file(upload_id)
         assert data == b"Hello World!"
 
+    @pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="posix_fallocate not available")
+    def test_preallocate_reserves_upload_length(self, temp_dir):
+        """With preallocate, the file is created at its full length and filled in place."""
+        storage = SQLiteStorage(
+            db_path=os.path.join(temp_dir, "prealloc.db"),
+            upload_dir=os.path.join(temp_dir, "uploads"),
+            preallocate=True,
+        )
+        storage.create_upload("full", 8, {})
+        assert os.path.getsize(storage.get_file_path("full")) == 8
+
+        storage.write_chunk("full", 0, b"abcd")
+        storage.write_chunk("full", 4, b"efgh")
+        assert storage.read_file("full") == b"abcdefgh"
+        storage.close()
+
+    def test_upload_file_stays_open_between_chunks(self, storage):
+        """Chunks reuse one open file, which delete_upload closes before removing."""
+        from unittest import mock
+
+        storage.create_upload("open", 6, {})
+        with mock.patch("os.open", wraps=os.open) as os_open:
+            storage.write_chunk("open", 0, b"abc")
+            storage.write_chunk_stream("open", 3, io.BytesIO(b"def"), 3)
+        assert os_open.call_count == 1
+        assert storage.read_file("open") == b"abcdef"
+
+        f = storage._open_files["open"]
+        storage.delete_upload("open")
+        assert f.closed
+        assert not os.path.exists(storage.get_file_path("open"))
+
+    def test_write_chunk_stream_with_and_without_readinto(self, storage):
+        """write_chunk_stream copies from readinto-capable and read-only streams."""
+        import io
+
+        class ReadOnlyStream:
+            def __init__(self, data):
+                self._stream = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self._stream.read(size)
+
+        upload_id = "test-upload-stream"
+        storage.create_upload(upload_id, 100, {})
+
+        assert storage.write_chunk_stream(upload_id, 0, io.BytesIO(b"Hello XX"), 6) == 6
+        assert storage.write_chunk_stream(upload_id, 6, ReadOnlyStream(b"World!"), 10) == 6
+        assert storage.read_file(upload_id) == b"Hello World!"
+
     def test_delete_upload(self, storage, temp_dir):
         """Test deleting an upload."""
         upload_id = "test-upload-4"
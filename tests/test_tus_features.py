@@ -7,7 +7,7 @@ import pytest
 
 from resumable_upload.exceptions import TusCommunicationError, TusUploadFailed
 from resumable_upload.fingerprint import Fingerprint
-from resumable_upload.url_storage import FileURLStorage
+from resumable_upload.url_storage import BufferedURLStorage, FileURLStorage
 
 
 class TestExceptions:
@@ -66,6 +66,70 @@ class TestFingerprint:
         finally:
             os.unlink(temp_path)
 
+    def test_fingerprint_subclass_without_super_init(self):
+        """A subclass whose __init__ skips Fingerprint.__init__ still fingerprints paths."""
+
+        class CustomFingerprint(Fingerprint):
+            def __init__(self):
+                self.calls = 0
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("test content")
+            temp_path = f.name
+
+        try:
+            fp = CustomFingerprint().get_fingerprint(temp_path)
+            assert fp == Fingerprint().get_fingerprint(temp_path)
+            assert Fingerprint._cache is None
+        finally:
+            os.unlink(temp_path)
+
+    def test_fingerprint_cached_until_file_changes(self):
+        """Unchanged files are not re-hashed; a modified file is."""
+        from unittest import mock
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("test content")
+            temp_path = f.name
+
+        try:
+            fingerprinter = Fingerprint()
+            with mock.patch.object(
+                fingerprinter,
+                "_fingerprint_from_stream",
+                wraps=fingerprinter._fingerprint_from_stream,
+            ) as spy:
+                fp1 = fingerprinter.get_fingerprint(temp_path)
+                assert fingerprinter.get_fingerprint(temp_path) == fp1
+                # Another spelling of the same path hits the cache too
+                relative = os.path.relpath(temp_path)
+                assert fingerprinter.get_fingerprint(relative) == fp1
+                assert spy.call_count == 1
+
+                with open(temp_path, "w") as f:
+                    f.write("other content!")
+                assert fingerprinter.get_fingerprint(temp_path) != fp1
+                assert spy.call_count == 2
+        finally:
+            os.unlink(temp_path)
+
+    def test_sampled_fingerprint_hashes_head_and_tail(self):
+        """sample_size bounds hashing to the file's first and last bytes."""
+        import io
+
+        head, tail = b"h" * 100, b"t" * 100
+        fingerprinter = Fingerprint(sample_size=100)
+        fp1 = fingerprinter.get_fingerprint(io.BytesIO(head + b"a" * 1000 + tail))
+        fp2 = fingerprinter.get_fingerprint(io.BytesIO(head + b"b" * 1000 + tail))
+        fp3 = fingerprinter.get_fingerprint(io.BytesIO(head + b"a" * 1000 + b"x" * 100))
+
+        assert fp1 == fp2  # the middle is not sampled
+        assert fp1 != fp3
+        assert fp1.startswith("size:1200--sha256s:")
+        # Small files are still hashed in full
+        small = fingerprinter.get_fingerprint(io.BytesIO(b"x" * 150))
+        assert small == Fingerprint().get_fingerprint(io.BytesIO(b"x" * 150))
+
     def test_fingerprint_from_stream(self):
         """Test fingerprint generation from file stream."""
         with tempfile.NamedTemporaryFile(mode="w+b", delete=False) as f:
@@ -198,6 +262,67 @@ class TestURLStorage:
         finally:
             os.unlink(storage_path)
 
+    def test_buffered_url_storage_batches_writes(self):
+        """BufferedURLStorage serves pending changes and writes them in one batch."""
+        from unittest.mock import patch
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+            storage_path = f.name
+
+        try:
+            backend = FileURLStorage(storage_path)
+            backend.set_url("old", "http://example.com/files/old")
+            storage = BufferedURLStorage(backend, flush_every=3)
+
+            with patch.object(backend, "_append", wraps=backend._append) as save:
+                storage.set_url("a", "http://example.com/files/a")
+                storage.remove_url("old")
+                assert storage.get_url("a") == "http://example.com/files/a"
+                assert storage.get_url("old") is None
+                assert backend.get_url("a") is None
+                assert save.call_count == 0
+
+                storage.set_url("b", "http://example.com/files/b")
+                assert save.call_count == 1
+                assert backend.get_url("a") == "http://example.com/files/a"
+                assert backend.get_url("old") is None
+
+                with storage:
+                    storage.set_url("c", "http://example.com/files/c")
+                assert save.call_count == 2
+                assert FileURLStorage(storage_path).get_url("c") == "http://example.com/files/c"
+        finally:
+            os.unlink(storage_path)
+
+    def test_file_url_storage_journals_changes(self):
+        """Changes are appended to a journal, seen by other instances and compacted."""
+        import json
+        from unittest.mock import patch
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "urls.json")
+            writer = FileURLStorage(storage_path)
+            reader = FileURLStorage(storage_path)
+            assert reader.get_url("a") is None
+
+            with patch.object(writer, "_save_data") as save:
+                writer.set_url("a", "http://example.com/files/a")
+                writer.update_urls({"b": "http://example.com/files/b", "a": None})
+            assert save.call_count == 0
+            with open(storage_path + ".log") as f:
+                assert len(f.readlines()) == 3
+
+            assert reader.get_url("a") is None
+            assert reader.get_url("b") == "http://example.com/files/b"
+
+            writer.compact()
+            assert os.path.getsize(storage_path + ".log") == 0
+            with open(storage_path) as f:
+                assert json.load(f) == {"b": "http://example.com/files/b"}
+            reader.set_url("c", "http://example.com/files/c")
+            assert reader.get_url("b") == "http://example.com/files/b"
+            assert writer.get_url("c") == "http://example.com/files/c"
+
     def test_file_url_storage_nonexistent_key(self):
         """Test getting URL for nonexistent fingerprint."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
@@ -270,14 +395,18 @@ class TestURLStorage:
         try:
             storage = FileURLStorage(storage_path)
             storage.set_url("fp_existing", "url_existing")
+            storage.compact()
+            storage.set_url("fp_new", "url_new")
 
             # Simulate crash: make os.replace raise so the file is never overwritten
             replace_err = unittest.mock.patch("os.replace", side_effect=OSError("disk full"))
             with replace_err, pytest.raises(OSError):
-                storage.set_url("fp_new", "url_new")
+                storage.compact()
 
-            # Original data must still be intact
-            assert storage.get_url("fp_existing") == "url_existing"
+            # Original data and the journal must still be intact
+            reopened = FileURLStorage(storage_path)
+            assert reopened.get_url("fp_existing") == "url_existing"
+            assert reopened.get_url("fp_new") == "url_new"
         finally:
             os.unlink(storage_path)
 
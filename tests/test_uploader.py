@@ -315,6 +315,31 @@ class TestUploader:
 
         uploader.close()
 
+    def test_patch_headers_include_custom_headers(self, test_file, server):
+        """PATCH requests carry custom headers, including ones changed between calls."""
+        from unittest.mock import patch
+
+        url, storage = server
+        client = TusClient(url)
+        upload_url = client._create_upload(os.path.getsize(test_file), {})
+        uploader = Uploader(
+            url=upload_url, file_path=test_file, chunk_size=1024, headers={"X-Custom": "a"}
+        )
+
+        with patch.object(uploader._pool, "request", wraps=uploader._pool.request) as spy:
+            uploader.upload_chunk()
+            uploader.headers["X-Custom"] = "b"
+            uploader.upload()
+
+        patches = [c.kwargs["headers"] for c in spy.call_args_list if c.args[0] == "PATCH"]
+        assert patches[0]["X-Custom"] == "a"
+        assert patches[0]["Upload-Offset"] == "0"
+        assert patches[0]["Content-Length"] == "1024"
+        assert all(h["X-Custom"] == "b" for h in patches[1:])
+        assert patches[1]["Upload-Offset"] == "1024"
+        assert uploader.is_complete
+        uploader.close()
+
     def test_uploader_without_checksum(self, test_file, server):
         """Test uploader with checksum disabled."""
         url, storage = server
@@ -371,9 +396,7 @@ class TestUploader:
 
         uploader = Uploader(url=upload_url, file_path=test_file)
 
-        urlopen_err = patch(
-            "resumable_upload.client.uploader.urlopen", side_effect=URLError("network error")
-        )
+        urlopen_err = patch.object(uploader._pool, "request", side_effect=URLError("network error"))
         with urlopen_err, pytest.raises(TusCommunicationError):
             uploader._get_offset()
 
@@ -442,8 +465,8 @@ class TestUploader:
             retry_delay=0.0,
         )
 
-        urlopen_patch = unittest.mock.patch(
-            "resumable_upload.client.uploader.urlopen", side_effect=failing_urlopen
+        urlopen_patch = unittest.mock.patch.object(
+            uploader._pool, "request", side_effect=failing_urlopen
         )
         with urlopen_patch, pytest.raises(TusUploadFailed):
             uploader.upload_chunk()
@@ -471,13 +494,6 @@ class TestUploader:
 
         attempt = 0
 
-        def fail_once(*args, **kwargs):
-            nonlocal attempt
-            attempt += 1
-            if attempt == 1:
-                raise URLError("first attempt fails")
-            return real_urlopen(*args, **kwargs)
-
         uploader = Uploader(
             url=upload_url,
             file_path=test_file,
@@ -485,10 +501,16 @@ class TestUploader:
             max_retries=2,
             retry_delay=0.0,
         )
+        real_request = uploader._pool.request
 
-        urlopen_once = unittest.mock.patch(
-            "resumable_upload.client.uploader.urlopen", side_effect=fail_once
-        )
+        def fail_once(*args, **kwargs):
+            nonlocal attempt
+            attempt += 1
+            if attempt == 1:
+                raise URLError("first attempt fails")
+            return real_request(*args, **kwargs)
+
+        urlopen_once = unittest.mock.patch.object(uploader._pool, "request", side_effect=fail_once)
         with urlopen_once:
             uploader.upload_chunk()
 
@@ -539,8 +561,6 @@ class TestUploader:
 
     def test_upload_chunk_raises_on_truncated_file(self, test_file, server):
         """upload_chunk() raises OSError if file is shorter than expected."""
-        import unittest.mock
-
         url, storage = server
 
         from urllib.parse import urljoin
@@ -555,9 +575,403 @@ class TestUploader:
 
         uploader = Uploader(url=upload_url, file_path=test_file, chunk_size=1024)
 
-        # Simulate a file that returns empty bytes unexpectedly
-        read_patch = unittest.mock.patch.object(uploader._file_handle, "read", return_value=b"")
-        with read_patch, pytest.raises(OSError, match="Unexpected end of file"):
+        # Truncate the file behind the uploader's back so reads come back empty
+        with open(test_file, "r+b") as f:
+            f.truncate(0)
+        with pytest.raises(OSError, match="Unexpected end of file"):
             uploader.upload_chunk()
 
         uploader.close()
+
+    def test_upload_with_prefetch_chunks(self, test_file, server):
+        """upload() with read-ahead enabled uploads the file byte-for-byte."""
+        url, storage = server
+        client = TusClient(url)
+        uploader = client.create_uploader(test_file, chunk_size=1024)
+        uploader.prefetch_chunks = 2
+
+        uploader.upload()
+
+        upload_id = uploader.url.split("/")[-1]
+        with open(test_file, "rb") as f:
+            assert storage.read_file(upload_id) == f.read()
+        assert uploader.is_complete is True
+        uploader.close()
+
+    def test_prefetcher_reuses_buffer_pool(self, temp_dir):
+        """Prefetched chunks are read into a fixed pool of reused buffers.
+
+        Free buffers are filled together by one vectored read.
+        """
+        from resumable_upload.client.uploader import _ChunkPrefetcher
+
+        data = os.urandom(64 * 1024)
+        file_path = os.path.join(temp_dir, "random.bin")
+        with open(file_path, "wb") as f:
+            f.write(data)
+
+        with open(file_path, "rb") as f:
+            reads = []
+
+            def read_into(views, offset):
+                reads.append(len(views))
+                return os.preadv(f.fileno(), views, offset)
+
+            prefetcher = _ChunkPrefetcher(
+                None, lambda chunk: None, 0, len(data), lambda: 4096, 2, read_into
+            )
+            received = []
+            buffers = set()
+            while True:
+                offset, chunk, _ = prefetcher.get()
+                if not chunk:
+                    break
+                assert offset == len(received) * 4096
+                received.append(bytes(chunk))
+                buffers.add(id(prefetcher._held))
+            prefetcher.close()
+
+        assert b"".join(received) == data
+        assert len(buffers) <= 4
+        # All four buffers start free, so the first read fills them at once
+        assert reads[0] == 4
+
+    def test_retry_reuses_chunk_checksum(self, test_file, server):
+        """The chunk checksum is computed once, not once per retry attempt."""
+        import unittest.mock
+        from urllib.error import URLError
+
+        url, _ = server
+        client = TusClient(url, retry_delay=0.0)
+        uploader = client.create_uploader(test_file, chunk_size=1024)
+        real_request = uploader._pool.request
+        attempts = 0
+
+        def fail_twice(*args, **kwargs):
+            nonlocal attempts
+            if args[0] == "PATCH":
+                attempts += 1
+                if attempts <= 2:
+                    raise URLError("transient failure")
+            return real_request(*args, **kwargs)
+
+        hash_spy = unittest.mock.patch.object(
+            uploader, "_compute_checksum", wraps=uploader._compute_checksum
+        )
+        request_patch = unittest.mock.patch.object(
+            uploader._pool, "request", side_effect=fail_twice
+        )
+        with hash_spy as spy, request_patch:
+            uploader.upload_chunk()
+
+        assert attempts == 3
+        assert spy.call_count == 1
+        uploader.close()
+
+    def test_progress_interval_throttles_callbacks(self, test_file, server):
+        """progress_interval limits callbacks but always reports completion."""
+        url, _ = server
+        client = TusClient(url)
+        upload_url = client._create_upload(os.path.getsize(test_file), {})
+        uploader = Uploader(upload_url, file_path=test_file, chunk_size=100, progress_interval=3600)
+
+        calls = []
+        uploader.upload(progress_callback=calls.append)
+
+        assert len(calls) == 2  # first chunk, then the final one
+        assert calls[-1].uploaded_bytes == uploader.file_size
+        uploader.close()
+
+    def test_adaptive_chunk_size_grows_on_fast_link(self, test_file, server):
+        """Fast PATCHes grow the send size (at most 2x per chunk) and stats stay nominal."""
+        url, _ = server
+        client = TusClient(url)
+        upload_url = client._create_upload(os.path.getsize(test_file), {})
+        uploader = Uploader(upload_url, file_path=test_file, adaptive_chunk_size=True)
+
+        uploader._adapt_chunk_size(256 * 1024, 0.001)
+        assert uploader._send_size == 512 * 1024
+        uploader._adapt_chunk_size(512 * 1024, 10.0)
+        assert uploader._send_size == 256 * 1024
+        uploader._adapt_chunk_size(16 * 1024 * 1024, 0.001)
+        assert uploader._send_size == 16 * 1024 * 1024
+
+        uploader.upload()
+        assert uploader.offset == uploader.file_size
+        assert uploader.chunk_size == 8 * 1024 * 1024
+        uploader.close()
+
+    def test_adaptive_chunk_size_bounds_are_configurable(self, test_file, server):
+        """min_chunk_size/max_chunk_size bound the adapted PATCH size."""
+        url, _ = server
+        client = TusClient(url, min_chunk_size=1024, max_chunk_size=4096)
+        uploader = client.create_uploader(test_file)
+
+        uploader._adapt_chunk_size(4096, 0.001)
+        assert uploader._send_size == 4096
+        uploader._adapt_chunk_size(1024, 10.0)
+        assert uploader._send_size == 1024
+        uploader.close()
+
+        with pytest.raises(ValueError, match="chunk size bounds"):
+            Uploader(uploader.url, file_path=test_file, min_chunk_size=10, max_chunk_size=5)
+
+    @pytest.mark.skipif(not hasattr(os, "preadv"), reason="os.preadv not available")
+    def test_sequential_reads_reuse_chunk_buffer(self, test_file, server):
+        """Chunks read on the upload thread share one preallocated buffer."""
+        url, _ = server
+        client = TusClient(url)
+        uploader = client.create_uploader(test_file, chunk_size=100)
+
+        first = uploader._read_chunk_reuse(0, 100)
+        assert bytes(first) == uploader._read_chunk(0, 100)
+        second = uploader._read_chunk_reuse(100, 100)
+        assert second.obj is first.obj
+        assert bytes(second) == uploader._read_chunk(100, 100)
+        uploader.close()
+
+    def test_closed_uploader_returns_buffer_to_shared_pool(self, test_file, server):
+        """A later uploader with the same chunk size reuses the released buffer."""
+        url, _ = server
+        client = TusClient(url)
+        first = client.create_uploader(test_file, chunk_size=123)
+        buffer = first._read_chunk_reuse(0, 123).obj
+        first.close()
+
+        second = client.create_uploader(test_file, chunk_size=123)
+        assert second._read_chunk_reuse(0, 123).obj is buffer
+        second.close()
+
+    def test_stream_reads_reuse_chunk_buffer(self, test_file, server):
+        """A plain binary file_stream is read with readinto() into the reused buffer."""
+        import io
+
+        url, _ = server
+        client = TusClient(url)
+        with open(test_file, "rb") as f:
+            data = f.read()
+        uploader = client.create_uploader(file_stream=io.BytesIO(data), chunk_size=100)
+
+        first = uploader._read_chunk_reuse(0, 100)
+        assert bytes(first) == data[:100]
+        second = uploader._read_chunk_reuse(100, 100)
+        assert second.obj is first.obj
+        assert bytes(second) == data[100:200]
+        # Out-of-order offsets still seek
+        assert bytes(uploader._read_chunk_reuse(50, 100)) == data[50:150]
+        uploader.close()
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_reads_advise_sequential_access(self, test_file, server):
+        """The file is marked sequential and the next chunk is prefetched by the kernel."""
+        from unittest import mock
+
+        url, _ = server
+        client = TusClient(url)
+        with mock.patch("os.posix_fadvise") as fadvise:
+            uploader = client.create_uploader(test_file, chunk_size=1024)
+            uploader.upload_chunk()
+            uploader.close()
+
+        fd = fadvise.call_args_list[0].args[0]
+        size = os.path.getsize(test_file)
+        assert fadvise.call_args_list == [
+            mock.call(fd, 0, size, os.POSIX_FADV_SEQUENTIAL),
+            mock.call(fd, 1024, 1024, os.POSIX_FADV_WILLNEED),
+        ]
+
+    def test_owned_file_is_read_unbuffered(self, test_file, server, monkeypatch):
+        """A file opened by the uploader skips the BufferedReader layer."""
+        import io
+
+        url, storage = server
+        client = TusClient(url)
+        # Without pread (e.g. Windows) chunks come from the file object itself
+        monkeypatch.delattr(os, "pread", raising=False)
+        uploader = client.create_uploader(test_file, chunk_size=1024)
+        assert type(uploader._file_handle) is io.FileIO
+        uploader.upload()
+        uploader.close()
+
+        with open(test_file, "rb") as f:
+            assert storage.read_file(uploader.url.split("/")[-1]) == f.read()
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="os.pread not available")
+    def test_binary_file_stream_uses_positional_reads(self, test_file, temp_dir, server):
+        """An open binary file passed as file_stream is read with pread, wrappers are not."""
+        import gzip
+
+        url, storage = server
+        client = TusClient(url)
+        with open(test_file, "rb") as f:
+            uploader = client.create_uploader(file_stream=f, chunk_size=1024)
+            assert uploader._fd == f.fileno()
+            uploader.upload()
+            uploader.close()
+            f.seek(0)
+            assert storage.read_file(uploader.url.split("/")[-1]) == f.read()
+
+        gz_path = os.path.join(temp_dir, "data.gz")
+        with gzip.open(gz_path, "wb") as gz:
+            gz.write(b"compressed")
+        with gzip.open(gz_path, "rb") as gz:
+            uploader = client.create_uploader(file_stream=gz)
+            assert uploader._fd is None
+            uploader.close()
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="os.pread not available")
+    def test_range_reader_stream_uses_positional_reads(self, temp_dir, server):
+        """A range reader file_stream is read via its descriptor at shifted offsets."""
+        from resumable_upload.client.uploader import _RangeFileReader
+
+        url, storage = server
+        data = os.urandom(10000)
+        path = os.path.join(temp_dir, "range.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        client = TusClient(url, chunk_size=1000)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            upload_url = client._create_upload(4000, {})
+            uploader = Uploader(
+                upload_url, file_stream=_RangeFileReader(fd, 3000, 4000), chunk_size=1000
+            )
+            assert (uploader._fd, uploader._fd_base) == (fd, 3000)
+            assert bytes(uploader._read_chunk_reuse(1000, 500)) == data[4000:4500]
+            uploader.upload()
+            uploader.close()
+        finally:
+            os.close(fd)
+
+        upload_id = upload_url.rstrip("/").split("/")[-1]
+        assert storage.read_file(upload_id) == data[3000:7000]
+
+    def test_upload_with_direct_io(self, temp_dir, server):
+        """direct_io reads unaligned ranges correctly (or falls back) and uploads intact."""
+        url, storage = server
+        data = os.urandom(3 * 4096 + 123)
+        path = os.path.join(temp_dir, "direct.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        client = TusClient(url, chunk_size=5000, direct_io=True)
+        uploader = client.create_uploader(path)
+        if hasattr(os, "O_DIRECT") and uploader._direct_fd is not None:
+            assert bytes(uploader._read_chunk_reuse(4000, 5000)) == data[4000:9000]
+            assert uploader._read_chunk(12000, 5000) == data[12000:]
+            assert bytes(uploader._read_chunk_reuse(len(data), 10)) == b""
+        uploader.upload()
+        uploader.close()
+        assert uploader._direct_fd is None
+
+        upload_id = uploader.url.rstrip("/").split("/")[-1]
+        assert storage.read_file(upload_id) == data
+
+    def test_upload_with_mmap(self, test_file, server):
+        """use_mmap uploads memoryview slices of the mapped file."""
+        url, storage = server
+        client = TusClient(url, use_mmap=True)
+        uploader = client.create_uploader(test_file, chunk_size=1000)
+        assert isinstance(uploader._read_chunk(0, 10), memoryview)
+
+        upload_url = uploader.upload()
+        uploader.close()
+
+        upload_id = upload_url.rstrip("/").split("/")[-1]
+        with open(test_file, "rb") as f:
+            assert storage.read_file(upload_id) == f.read()
+
+    def test_large_chunk_checksum_matches_single_pass(self, test_file, server):
+        """Chunks hashed in slices produce the same digest as one hashlib call."""
+        import base64
+        import hashlib
+
+        url, _ = server
+        client = TusClient(url)
+        uploader = client.create_uploader(test_file)
+        data = os.urandom(3 * 1024 * 1024 + 7)
+
+        expected = base64.b64encode(hashlib.sha1(data).digest()).decode("ascii")
+        assert uploader._compute_checksum(data) == f"sha1 {expected}"
+        uploader.close()
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="os.pread not available")
+    def test_unchecksummed_large_chunks_stream_from_file(self, temp_dir, server):
+        """Without a checksum, large chunks are streamed as range readers and retried intact."""
+        from unittest.mock import patch
+        from urllib.error import URLError
+
+        from resumable_upload.client.uploader import _RangeFileReader
+
+        url, storage = server
+        data = os.urandom(5 * 1024 * 1024 + 3)
+        path = os.path.join(temp_dir, "large.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        client = TusClient(url, checksum=False, chunk_size=2 * 1024 * 1024)
+        uploader = client.create_uploader(path)
+        request = uploader._pool.request
+        failed = []
+
+        def flaky_request(method, url, headers=None, body=None):
+            if method == "PATCH" and not failed:
+                # Consume part of the stream, then fail so the retry must rewind it
+                body.read(1000)
+                failed.append(True)
+                raise URLError("connection reset")
+            return request(method, url, headers=headers, body=body)
+
+        with patch.object(uploader._pool, "request", side_effect=flaky_request) as spy:
+            uploader.retry_delay = 0
+            uploader.upload()
+
+        bodies = [c.kwargs["body"] for c in spy.call_args_list if c.args[0] == "PATCH"]
+        assert len(bodies) == 4
+        assert all(isinstance(b, _RangeFileReader) for b in bodies)
+        upload_id = uploader.url.rstrip("/").split("/")[-1]
+        assert storage.read_file(upload_id) == data
+        uploader.close()
+
+    @pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile not available")
+    def test_streamed_chunks_use_sendfile_over_http(self, temp_dir, server):
+        """Range reader bodies are handed to sendfile instead of read through Python."""
+        from unittest.mock import patch
+
+        from resumable_upload.client.uploader import _RangeFileReader
+
+        url, storage = server
+        data = os.urandom(3 * 1024 * 1024 + 5)
+        path = os.path.join(temp_dir, "large.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        client = TusClient(url, checksum=False, chunk_size=2 * 1024 * 1024)
+        uploader = client.create_uploader(path)
+        sendfile = patch.object(
+            _RangeFileReader, "sendfile", autospec=True, side_effect=_RangeFileReader.sendfile
+        )
+        with sendfile as spy:
+            uploader.upload()
+
+        assert spy.call_count == 2
+        upload_id = uploader.url.rstrip("/").split("/")[-1]
+        assert storage.read_file(upload_id) == data
+        uploader.close()
+
+    def test_retry_backoff_is_capped_and_jittered(self, test_file, server):
+        """Backoff doubles per attempt, is capped by retry_max_delay and jittered."""
+        url, _ = server
+        client = TusClient(url)
+        uploader = client.create_uploader(test_file)
+        uploader.retry_delay = 1.0
+        uploader.retry_max_delay = 5.0
+
+        uploader.retry_jitter = 0.0
+        assert [uploader._retry_backoff(a) for a in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+        uploader.retry_jitter = 0.1
+        delays = [uploader._retry_backoff(10) for _ in range(50)]
+        assert all(4.5 <= d <= 5.5 for d in delays)
+        uploader.close()